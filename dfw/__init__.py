@@ -5,24 +5,26 @@ A comprehensive digital forensics analysis platform integrating
 industry-standard tools with a modern GUI interface.
 """
 
+import importlib
+
 __version__ = "3.0.0"
 __author__ = "Mr.T"
 
-# Import all modules
-from . import (
-    env,
-    mount,
-    keywords,
-    forensic_tools,
-    os_detector,
-    browser_forensics,
-    registry_analyzer,
-    tool_manager,
-    notes_terminal
+# Submodules are imported on first attribute access (PEP 562)
+_SUBMODULES = (
+    'env',
+    'mount',
+    'keywords',
+    'forensic_tools',
+    'os_detector',
+    'browser_forensics',
+    'registry_analyzer',
+    'tool_manager',
+    'notes_terminal'
 )
 
-# Main application
-from .main_app import CompleteDFW, main
+# Main application names, provided by .main_app
+_MAIN_APP_NAMES = ('CompleteDFW', 'main')
 
 __all__ = [
     'env',
@@ -37,3 +39,15 @@ __all__ = [
     'CompleteDFW',
     'main'
 ]
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    if name in _MAIN_APP_NAMES:
+        return getattr(importlib.import_module('.main_app', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
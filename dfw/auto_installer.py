@@ -9,16 +9,219 @@ import sys
 import platform
 import subprocess
 import shutil
-import urllib.request
 import tempfile
 import zipfile
 import tarfile
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import json
+import hashlib
 import threading
-from tkinter import messagebox, Toplevel, Label, Text, Button, Frame
-from tkinter import ttk, BOTH, END, X, Y, LEFT, RIGHT, BOTTOM
+import queue
+import time
+import functools
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+
+# Seconds a tool availability probe result stays valid
+AVAILABILITY_CACHE_TTL = 60
+
+# Availability results persisted across runs, and how long they stay valid
+PRESENCE_CACHE_FILE = Path.home() / ".dfw" / "tool_presence.json"
+PRESENCE_CACHE_TTL = 24 * 60 * 60
+
+# Minimum seconds between writes of the presence cache file
+PRESENCE_SAVE_INTERVAL = 1
+
+# Maximum number of tools installed concurrently by install_all_tools
+INSTALL_WORKERS = 4
+
+# Milliseconds between UI queue drains in the installation dialogs
+UI_POLL_INTERVAL_MS = 50
+
+
+def _run(cmd, **kwargs):
+    """Run a command without closing inherited fds.
+
+    Leaving ``close_fds`` off lets CPython use ``posix_spawn()`` instead of
+    ``fork()``, which is much cheaper from a large GUI process.
+    """
+    return subprocess.run(cmd, close_fds=False, **kwargs)
+
+
+def _apt_command(packages: List[str]) -> List[str]:
+    """Build the apt-get install command line."""
+    return ["sudo", "apt-get", "install"] + packages
+
+
+def _pip_command(packages: List[str]) -> List[str]:
+    """Build the pip install command line."""
+    return ["pip3", "install"] + packages
+
+
+def _snap_command(packages: List[str]) -> List[str]:
+    """Build the snap install command line."""
+    return ["sudo", "snap", "install"] + packages
+
+
+def _git_command(args: List[str]) -> List[str]:
+    """Build the git clone command line."""
+    return ["git", "clone"] + args
+
+
+@functools.lru_cache(maxsize=1)
+def _get_linux_distro() -> Optional[str]:
+    """Get Linux distribution name."""
+    if not sys.platform.startswith("linux"):
+        return None
+    
+    try:
+        text = Path('/etc/os-release').read_text()
+    except OSError:
+        return None
+    
+    release = dict(line.partition('=')[::2] for line in text.splitlines() if '=' in line)
+    return release.get('ID', '').strip().strip('"') or None
+
+
+# Linux install step kind -> argv builder
+_LINUX_INSTALL_COMMANDS = {
+    "apt": _apt_command,
+    "pip": _pip_command,
+    "snap": _snap_command,
+    "git": _git_command,
+}
+
+
+# Tool definitions.
+# "linux_install" is a (kind, args) step, or a list of steps run in order;
+# see _LINUX_INSTALL_COMMANDS.
+_TOOLS = types.MappingProxyType({
+    "plaso": {
+        "name": "Plaso (log2timeline/psort)",
+        "description": "Timeline generation and analysis",
+        "linux_install": ("pip", ["plaso"]),
+        "windows_available": False,
+        "binary": "log2timeline.py",
+        "check_command": ["log2timeline.py", "--version"],
+        "required": True
+    },
+    "sleuthkit": {
+        "name": "The Sleuth Kit",
+        "description": "Disk and file system analysis",
+        "linux_install": ("apt", ["sleuthkit"]),
+        "windows_available": True,
+        "windows_url": "https://github.com/sleuthkit/sleuthkit/releases",
+        "binary": "fls",
+        "check_command": ["fls", "-V"],
+        "required": True
+    },
+    "volatility": {
+        "name": "Volatility 3",
+        "description": "Memory analysis framework",
+        "linux_install": ("pip", ["volatility3"]),
+        "windows_available": True,
+        "windows_install": "pip install volatility3",
+        "binary": "vol",
+        "check_command": ["vol", "--help"],
+        "required": True
+    },
+    "yara": {
+        "name": "YARA",
+        "description": "Malware identification and classification",
+        "linux_install": [("apt", ["yara"]), ("pip", ["yara-python"])],
+        "windows_available": True,
+        "windows_install": "pip install yara-python",
+        "binary": "yara",
+        "check_command": ["yara", "--version"],
+        "required": False
+    },
+    "bulk_extractor": {
+        "name": "Bulk Extractor",
+        "description": "Digital forensics tool for extracting information",
+        "linux_install": ("apt", ["bulk-extractor"]),
+        "windows_available": False,
+        "binary": "bulk_extractor",
+        "check_command": ["bulk_extractor", "-h"],
+        "required": False
+    },
+    "regripper": {
+        "name": "RegRipper",
+        "description": "Windows registry analysis",
+        "linux_install": ("git", ["https://github.com/keydet89/RegRipper3.0.git", "/opt/regripper"]),
+        "windows_available": True,
+        "windows_url": "https://github.com/keydet89/RegRipper3.0",
+        "binary": "perl",
+        "check_file": "/opt/regripper/rip.pl",
+        "check_command": ["perl", "/opt/regripper/rip.pl"],
+        "required": False
+    },
+    "autopsy": {
+        "name": "Autopsy",
+        "description": "Digital forensics platform",
+        "linux_install": ("snap", ["autopsy"]),
+        "windows_available": True,
+        "windows_url": "https://www.autopsy.com/download/",
+        "binary": "autopsy",
+        "check_command": ["autopsy", "--version"],
+        "required": False
+    },
+    "binwalk": {
+        "name": "Binwalk",
+        "description": "Firmware analysis tool",
+        "linux_install": ("apt", ["binwalk"]),
+        "windows_available": True,
+        "windows_install": "pip install binwalk",
+        "binary": "binwalk",
+        "check_command": ["binwalk", "--help"],
+        "required": False
+    },
+    "foremost": {
+        "name": "Foremost",
+        "description": "File carving tool",
+        "linux_install": ("apt", ["foremost"]),
+        "windows_available": False,
+        "binary": "foremost",
+        "check_command": ["foremost", "-V"],
+        "required": False
+    },
+    "scalpel": {
+        "name": "Scalpel",
+        "description": "File carving tool",
+        "linux_install": ("apt", ["scalpel"]),
+        "windows_available": False,
+        "binary": "scalpel",
+        "check_command": ["scalpel", "-V"],
+        "required": False
+    }
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _can_install_tool(os_type: str, tool_name: str) -> bool:
+    """Check if tool can be automatically installed on an OS."""
+    tool_info = _TOOLS[tool_name]
+    
+    if os_type == "Linux":
+        return "linux_install" in tool_info
+    elif os_type == "Windows":
+        return tool_info.get("windows_available", False) and "windows_install" in tool_info
+    
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _is_tool_supported(os_type: str, tool_name: str) -> bool:
+    """Check if tool is supported on an OS."""
+    tool_info = _TOOLS[tool_name]
+    
+    if os_type == "Linux":
+        return True  # Most tools work on Linux
+    elif os_type == "Windows":
+        return tool_info.get("windows_available", False)
+    
+    return False
 
 
 class ToolInstaller:
@@ -28,108 +231,33 @@ class ToolInstaller:
         self.parent = parent_window
         self.os_type = platform.system()
         self.arch = platform.machine()
-        self.distro = self._get_linux_distro() if self.os_type == "Linux" else None
-        
-        # Tool definitions
-        self.tools = {
-            "plaso": {
-                "name": "Plaso (log2timeline/psort)",
-                "description": "Timeline generation and analysis",
-                "linux_install": "pip3 install plaso",
-                "windows_available": False,
-                "check_command": ["log2timeline.py", "--version"],
-                "required": True
-            },
-            "sleuthkit": {
-                "name": "The Sleuth Kit",
-                "description": "Disk and file system analysis",
-                "linux_install": "apt-get install sleuthkit",
-                "windows_available": True,
-                "windows_url": "https://github.com/sleuthkit/sleuthkit/releases",
-                "check_command": ["fls", "-V"],
-                "required": True
-            },
-            "volatility": {
-                "name": "Volatility 3",
-                "description": "Memory analysis framework",
-                "linux_install": "pip3 install volatility3",
-                "windows_available": True,
-                "windows_install": "pip install volatility3",
-                "check_command": ["vol", "--help"],
-                "required": True
-            },
-            "yara": {
-                "name": "YARA",
-                "description": "Malware identification and classification",
-                "linux_install": "apt-get install yara && pip3 install yara-python",
-                "windows_available": True,
-                "windows_install": "pip install yara-python",
-                "check_command": ["yara", "--version"],
-                "required": False
-            },
-            "bulk_extractor": {
-                "name": "Bulk Extractor",
-                "description": "Digital forensics tool for extracting information",
-                "linux_install": "apt-get install bulk-extractor",
-                "windows_available": False,
-                "check_command": ["bulk_extractor", "-h"],
-                "required": False
-            },
-            "regripper": {
-                "name": "RegRipper",
-                "description": "Windows registry analysis",
-                "linux_install": "git clone https://github.com/keydet89/RegRipper3.0.git /opt/regripper",
-                "windows_available": True,
-                "windows_url": "https://github.com/keydet89/RegRipper3.0",
-                "check_command": ["perl", "/opt/regripper/rip.pl"],
-                "required": False
-            },
-            "autopsy": {
-                "name": "Autopsy",
-                "description": "Digital forensics platform",
-                "linux_install": "snap install autopsy",
-                "windows_available": True,
-                "windows_url": "https://www.autopsy.com/download/",
-                "check_command": ["autopsy", "--version"],
-                "required": False
-            },
-            "binwalk": {
-                "name": "Binwalk",
-                "description": "Firmware analysis tool",
-                "linux_install": "apt-get install binwalk",
-                "windows_available": True,
-                "windows_install": "pip install binwalk",
-                "check_command": ["binwalk", "--help"],
-                "required": False
-            },
-            "foremost": {
-                "name": "Foremost",
-                "description": "File carving tool",
-                "linux_install": "apt-get install foremost",
-                "windows_available": False,
-                "check_command": ["foremost", "-V"],
-                "required": False
-            },
-            "scalpel": {
-                "name": "Scalpel",
-                "description": "File carving tool",
-                "linux_install": "apt-get install scalpel",
-                "windows_available": False,
-                "check_command": ["scalpel", "-V"],
-                "required": False
-            }
-        }
-    
-    def _get_linux_distro(self) -> Optional[str]:
-        """Get Linux distribution name."""
-        try:
-            with open('/etc/os-release', 'r') as f:
-                for line in f:
-                    if line.startswith('ID='):
-                        return line.split('=')[1].strip().strip('"')
-        except:
-            pass
-        return None
+        self.distro = _get_linux_distro() if self.os_type == "Linux" else None
+        
+        # Availability probe results: tool name -> (monotonic timestamp, available)
+        self._avail_cache: Dict[str, Tuple[float, bool]] = {}
+        
+        # Persisted probe results: probe key -> (wall clock timestamp, available)
+        self._presence_cache = self._load_presence_cache()
+        self._presence_lock = threading.Lock()
+        self._presence_dirty = False
+        self._presence_saved = 0.0
+        
+        # dpkg/snap hold a system-wide lock, so their installs must not overlap
+        self._pkg_lock = threading.Lock()
+        
+        # Concurrent pip runs race on shared dependencies and RECORD files in
+        # site-packages; pip steps get their own lock so they can still
+        # overlap with apt and snap
+        self._pip_lock = threading.Lock()
+        
+        # Whether apt-get update already ran in the current install batch
+        self._apt_updated = False
+        
+        # Tool definitions are shared by all installers
+        self.tools = _TOOLS
+        
+        # Status tree row ids of the installation dialog, keyed by tool name
+        self._row_iids: Dict[str, str] = {}
     
     def check_tool_availability(self, tool_name: str) -> bool:
         """Check if a tool is available on the system."""
@@ -137,18 +265,108 @@ class ToolInstaller:
         if not tool_info:
             return False
         
-        check_cmd = tool_info["check_command"]
+        cached = self._avail_cache.get(tool_name)
+        if cached and time.monotonic() - cached[0] < AVAILABILITY_CACHE_TTL:
+            return cached[1]
+        
+        key = self._presence_key(tool_info)
+        persisted = self._presence_cache.get(key)
+        if persisted and time.time() - persisted[0] < PRESENCE_CACHE_TTL:
+            self._avail_cache[tool_name] = (time.monotonic(), persisted[1])
+            return persisted[1]
+        
+        binary = tool_info.get("binary")
+        if binary:
+            # A PATH lookup is enough to tell whether the tool is installed
+            available = shutil.which(binary) is not None
+            check_file = tool_info.get("check_file")
+            if available and check_file:
+                available = os.path.isfile(check_file)
+        else:
+            check_cmd = tool_info["check_command"]
+            try:
+                result = _run(check_cmd, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL, timeout=2)
+                available = result.returncode == 0
+            except:
+                available = False
+        
+        self._avail_cache[tool_name] = (time.monotonic(), available)
+        self._presence_cache[key] = (time.time(), available)
+        self._save_presence_cache()
+        return available
+    
+    def invalidate(self, tool_name: str):
+        """Forget the cached availability of a tool."""
+        self._avail_cache.pop(tool_name, None)
+        tool_info = self.tools.get(tool_name)
+        if tool_info and self._presence_cache.pop(self._presence_key(tool_info), None):
+            self._save_presence_cache(force=True)
+    
+    def clear_cache(self):
+        """Forget all cached availability results."""
+        self._avail_cache.clear()
+        self._presence_cache.clear()
+        self._save_presence_cache(force=True)
+    
+    def _presence_key(self, tool_info: Dict) -> str:
+        """Hash everything that determines a tool's probe result on this host."""
+        probe = [self.os_type, self.distro, self.arch, tool_info.get("binary"),
+                 tool_info.get("check_file"), tool_info["check_command"]]
+        return hashlib.sha256(json.dumps(probe).encode()).hexdigest()
+    
+    def _load_presence_cache(self) -> Dict[str, Tuple[float, bool]]:
+        """Load unexpired probe results persisted by earlier runs."""
         try:
-            result = subprocess.run(check_cmd, capture_output=True, timeout=10)
-            return result.returncode == 0
-        except:
-            return False
+            with open(PRESENCE_CACHE_FILE, 'r') as f:
+                data = json.load(f)
+            now = time.time()
+            return {
+                key: (checked, available)
+                for key, (checked, available) in data.items()
+                if now - checked < PRESENCE_CACHE_TTL
+            }
+        except Exception:
+            return {}
+    
+    def _save_presence_cache(self, force: bool = False):
+        """Write probe results to disk, at most once per PRESENCE_SAVE_INTERVAL."""
+        with self._presence_lock:
+            if not force and time.monotonic() - self._presence_saved < PRESENCE_SAVE_INTERVAL:
+                self._presence_dirty = True
+                return
+            
+            try:
+                PRESENCE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = PRESENCE_CACHE_FILE.with_suffix('.tmp')
+                with open(tmp_file, 'w') as f:
+                    json.dump(dict(self._presence_cache), f)
+                os.replace(tmp_file, PRESENCE_CACHE_FILE)
+            except OSError:
+                pass
+            
+            self._presence_dirty = False
+            self._presence_saved = time.monotonic()
     
     def get_tool_status(self) -> Dict[str, Dict]:
         """Get status of all tools."""
+        # Probe all tools concurrently so one slow check does not stall the rest
+        tool_names = list(self.tools)
+        availability = {}
+        with ThreadPoolExecutor(max_workers=min(16, len(tool_names))) as executor:
+            futures = {
+                executor.submit(self.check_tool_availability, name): name
+                for name in tool_names
+            }
+            for future in as_completed(futures):
+                availability[futures[future]] = future.result()
+        
+        if self._presence_dirty:
+            self._save_presence_cache(force=True)
+        
         status = {}
         for tool_name, tool_info in self.tools.items():
-            available = self.check_tool_availability(tool_name)
+            available = availability[tool_name]
             can_install = self._can_install_tool(tool_name)
             
             status[tool_name] = {
@@ -164,25 +382,11 @@ class ToolInstaller:
     
     def _can_install_tool(self, tool_name: str) -> bool:
         """Check if tool can be automatically installed."""
-        tool_info = self.tools[tool_name]
-        
-        if self.os_type == "Linux":
-            return "linux_install" in tool_info
-        elif self.os_type == "Windows":
-            return tool_info.get("windows_available", False) and "windows_install" in tool_info
-        
-        return False
+        return _can_install_tool(self.os_type, tool_name)
     
     def _is_tool_supported(self, tool_name: str) -> bool:
         """Check if tool is supported on current OS."""
-        tool_info = self.tools[tool_name]
-        
-        if self.os_type == "Linux":
-            return True  # Most tools work on Linux
-        elif self.os_type == "Windows":
-            return tool_info.get("windows_available", False)
-        
-        return False
+        return _is_tool_supported(self.os_type, tool_name)
     
     def install_tool(self, tool_name: str) -> Tuple[bool, str]:
         """Install a specific tool."""
@@ -195,45 +399,45 @@ class ToolInstaller:
         
         try:
             if self.os_type == "Linux":
-                return self._install_linux_tool(tool_name, tool_info)
+                success, message = self._install_linux_tool(tool_name, tool_info)
             elif self.os_type == "Windows":
-                return self._install_windows_tool(tool_name, tool_info)
+                success, message = self._install_windows_tool(tool_name, tool_info)
             else:
                 return False, f"Unsupported operating system: {self.os_type}"
         
         except Exception as e:
             return False, f"Installation failed: {str(e)}"
+        
+        if success:
+            self.invalidate(tool_name)
+        return success, message
     
     def _install_linux_tool(self, tool_name: str, tool_info: Dict) -> Tuple[bool, str]:
         """Install tool on Linux."""
-        install_cmd = tool_info.get("linux_install")
-        if not install_cmd:
+        install_steps = tool_info.get("linux_install")
+        if not install_steps:
             return False, "No Linux installation method available"
-        
-        # Handle different installation methods
-        if install_cmd.startswith("apt-get"):
-            # Update package list first
-            subprocess.run(["sudo", "apt-get", "update"], check=False)
-            cmd = ["sudo"] + install_cmd.split()
-        elif install_cmd.startswith("pip"):
-            cmd = install_cmd.split()
-        elif install_cmd.startswith("snap"):
-            cmd = ["sudo"] + install_cmd.split()
-        elif install_cmd.startswith("git clone"):
-            # Handle git clone specially
-            parts = install_cmd.split()
-            repo_url = parts[2]
-            dest_path = parts[3] if len(parts) > 3 else f"/tmp/{tool_name}"
-            cmd = ["git", "clone", repo_url, dest_path]
-        else:
-            cmd = install_cmd.split()
+        if isinstance(install_steps, tuple):
+            install_steps = [install_steps]
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            if result.returncode == 0:
-                return True, f"{tool_info['name']} installed successfully"
-            else:
-                return False, f"Installation failed: {result.stderr}"
+            for kind, args in install_steps:
+                cmd = _LINUX_INSTALL_COMMANDS[kind](args)
+                if kind in ("apt", "snap"):
+                    with self._pkg_lock:
+                        if kind == "apt" and not self._apt_updated:
+                            # Update package list first, once per install batch
+                            _run(["sudo", "apt-get", "update"], check=False)
+                            self._apt_updated = True
+                        result = _run(cmd, capture_output=True, text=True, timeout=300)
+                elif kind == "pip":
+                    with self._pip_lock:
+                        result = _run(cmd, capture_output=True, text=True, timeout=300)
+                else:
+                    result = _run(cmd, capture_output=True, text=True, timeout=300)
+                if result.returncode != 0:
+                    return False, f"Installation failed: {result.stderr}"
+            return True, f"{tool_info['name']} installed successfully"
         except subprocess.TimeoutExpired:
             return False, "Installation timed out"
         except Exception as e:
@@ -244,9 +448,11 @@ class ToolInstaller:
         if "windows_install" in tool_info:
             install_cmd = tool_info["windows_install"]
             cmd = install_cmd.split()
+            lock = self._pip_lock if cmd[0] in ("pip", "pip3") else nullcontext()
             
             try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                with lock:
+                    result = _run(cmd, capture_output=True, text=True, timeout=300)
                 if result.returncode == 0:
                     return True, f"{tool_info['name']} installed successfully"
                 else:
@@ -258,27 +464,56 @@ class ToolInstaller:
             url = tool_info.get("windows_url", "")
             return False, f"Manual installation required. Download from: {url}"
     
-    def install_all_tools(self, progress_callback=None) -> Dict[str, Tuple[bool, str]]:
-        """Install all available tools."""
-        results = {}
-        total_tools = len([t for t in self.tools.keys() if self._can_install_tool(t)])
+    def iter_install_all(self, progress_callback=None):
+        """Install all available tools, yielding (tool_name, (success, message)) as each finishes."""
+        tool_names = [t for t in self.tools.keys() if self._can_install_tool(t)]
+        total_tools = len(tool_names)
+        if not total_tools:
+            return
         installed = 0
         
-        for tool_name in self.tools.keys():
-            if self._can_install_tool(tool_name):
-                if progress_callback:
-                    progress_callback(f"Installing {self.tools[tool_name]['name']}...", 
-                                    int((installed / total_tools) * 100))
-                
-                success, message = self.install_tool(tool_name)
-                results[tool_name] = (success, message)
+        # Tools that are already present need no install round-trip
+        status = self.get_tool_status()
+        pending = [name for name in tool_names if not status[name]["available"]]
+        for tool_name in tool_names:
+            if status[tool_name]["available"]:
                 installed += 1
-                
-                if progress_callback:
-                    progress_callback(f"Completed {self.tools[tool_name]['name']}", 
-                                    int((installed / total_tools) * 100))
+                yield tool_name, (True, f"{self.tools[tool_name]['name']} already installed")
+        
+        if progress_callback:
+            progress_callback(f"Installing {len(pending)} tools...", 
+                            int((installed / total_tools) * 100))
         
-        return results
+        # git clones run in parallel; apt/snap steps serialize on _pkg_lock
+        # and pip steps on _pip_lock
+        self._apt_updated = False
+        try:
+            with ThreadPoolExecutor(max_workers=INSTALL_WORKERS) as executor:
+                futures = {executor.submit(self.install_tool, name): name for name in pending}
+                for future in as_completed(futures):
+                    tool_name = futures[future]
+                    installed += 1
+                    
+                    if progress_callback:
+                        progress_callback(f"Completed {self.tools[tool_name]['name']}", 
+                                        int((installed / total_tools) * 100))
+                    
+                    yield tool_name, future.result()
+        finally:
+            self._apt_updated = False
+    
+    def install_all_tools(self, progress_callback=None) -> Dict[str, Tuple[bool, str]]:
+        """Install all available tools."""
+        return dict(self.iter_install_all(progress_callback))
+    
+    @staticmethod
+    def _status_row(status: Dict) -> Tuple[str, str, str]:
+        """Build the tree row values for a tool status entry."""
+        status_text = "✓ Installed" if status["available"] else "✗ Missing"
+        if not status["os_supported"]:
+            status_text = "⚠ Not supported"
+        
+        return status["name"], status_text, status["description"]
     
     def show_installation_dialog(self):
         """Show GUI dialog for tool installation."""
@@ -290,6 +525,10 @@ class ToolInstaller:
             self._show_windows_warning()
             return
         
+        # Tk is imported lazily so headless use of the installer never loads it
+        from tkinter import Toplevel, Label, Text, Button, Frame
+        from tkinter import ttk, BOTH, END, X, Y, LEFT, RIGHT
+        
         dialog = Toplevel(self.parent)
         dialog.title("Forensic Tools Installation")
         dialog.geometry("700x600")
@@ -328,16 +567,10 @@ class ToolInstaller:
         
         # Populate tool status
         tool_status = self.get_tool_status()
-        for tool_name, status in tool_status.items():
-            status_text = "✓ Installed" if status["available"] else "✗ Missing"
-            if not status["os_supported"]:
-                status_text = "⚠ Not supported"
-            
-            tree.insert('', 'end', values=(
-                status["name"],
-                status_text,
-                status["description"]
-            ))
+        self._row_iids = {
+            tool_name: tree.insert('', 'end', values=self._status_row(status))
+            for tool_name, status in tool_status.items()
+        }
         
         # Progress bar
         progress_frame = Frame(dialog)
@@ -361,12 +594,38 @@ class ToolInstaller:
         button_frame = Frame(dialog)
         button_frame.pack(fill=X, padx=10, pady=10)
         
+        # Worker threads never touch Tk directly; they post updates here and
+        # pump() applies them on the main loop.
+        ui_queue = queue.Queue()
+        
+        def pump():
+            try:
+                while True:
+                    kind, payload = ui_queue.get_nowait()
+                    if kind == "progress":
+                        message, percent = payload
+                        progress_label.config(text=message)
+                        progress_bar['value'] = percent
+                        log_text.insert(END, f"{message}\n")
+                        log_text.see(END)
+                    elif kind == "log":
+                        log_text.insert(END, payload)
+                        log_text.see(END)
+                    elif kind == "row":
+                        tool_name, values = payload
+                        tree.item(self._row_iids[tool_name], values=values)
+                    elif kind == "status":
+                        progress_label.config(text=payload)
+                    elif kind == "done":
+                        install_button.config(state='normal')
+            except queue.Empty:
+                pass
+            
+            if dialog.winfo_exists():
+                dialog.after(UI_POLL_INTERVAL_MS, pump)
+        
         def update_progress(message, percent):
-            progress_label.config(text=message)
-            progress_bar['value'] = percent
-            log_text.insert(END, f"{message}\n")
-            log_text.see(END)
-            dialog.update()
+            ui_queue.put(("progress", (message, percent)))
         
         def install_all():
             install_button.config(state='disabled')
@@ -375,38 +634,32 @@ class ToolInstaller:
             
             def install_thread():
                 try:
-                    results = self.install_all_tools(update_progress)
-                    
-                    # Update tree with new status
-                    for item in tree.get_children():
-                        tree.delete(item)
-                    
-                    updated_status = self.get_tool_status()
-                    for tool_name, status in updated_status.items():
-                        status_text = "✓ Installed" if status["available"] else "✗ Missing"
-                        if not status["os_supported"]:
-                            status_text = "⚠ Not supported"
+                    results = {}
+                    for tool_name, result in self.iter_install_all(update_progress):
+                        results[tool_name] = result
                         
-                        tree.insert('', 'end', values=(
-                            status["name"],
-                            status_text,
-                            status["description"]
-                        ))
+                        # Update only the row of the tool that just finished,
+                        # reusing the install outcome instead of probing again
+                        status = tool_status[tool_name]
+                        status["available"] = status["available"] or result[0]
+                        ui_queue.put(("row", (tool_name, self._status_row(status))))
                     
                     # Show summary
                     successful = sum(1 for success, _ in results.values() if success)
                     total = len(results)
                     
-                    log_text.insert(END, f"\nInstallation complete: {successful}/{total} tools installed successfully\n")
-                    progress_label.config(text=f"Installation complete: {successful}/{total} successful")
+                    ui_queue.put(("log", f"\nInstallation complete: {successful}/{total} tools installed successfully\n"))
+                    ui_queue.put(("status", f"Installation complete: {successful}/{total} successful"))
                     
                 except Exception as e:
-                    log_text.insert(END, f"Installation error: {str(e)}\n")
+                    ui_queue.put(("log", f"Installation error: {str(e)}\n"))
                 finally:
-                    install_button.config(state='normal')
+                    ui_queue.put(("done", None))
             
             threading.Thread(target=install_thread, daemon=True).start()
         
+        dialog.after(UI_POLL_INTERVAL_MS, pump)
+        
         install_button = Button(button_frame, text="Install All Tools", command=install_all)
         install_button.pack(side=LEFT, padx=5)
         
@@ -417,23 +670,17 @@ class ToolInstaller:
     
     def _refresh_tool_status(self, tree):
         """Refresh tool status in the tree."""
-        for item in tree.get_children():
-            tree.delete(item)
+        self.clear_cache()
         
-        tool_status = self.get_tool_status()
-        for tool_name, status in tool_status.items():
-            status_text = "✓ Installed" if status["available"] else "✗ Missing"
-            if not status["os_supported"]:
-                status_text = "⚠ Not supported"
-            
-            tree.insert('', 'end', values=(
-                status["name"],
-                status_text,
-                status["description"]
-            ))
+        # Update existing rows in place; keeps selection and scroll position
+        for tool_name, status in self.get_tool_status().items():
+            tree.item(self._row_iids[tool_name], values=self._status_row(status))
     
     def _show_windows_warning(self):
         """Show warning dialog for Windows users."""
+        from tkinter import Toplevel, Label, Button, Frame
+        from tkinter import BOTH, X, LEFT, RIGHT
+        
         warning_dialog = Toplevel(self.parent)
         warning_dialog.title("Windows Compatibility Notice")
         warning_dialog.geometry("600x400")
@@ -491,6 +738,9 @@ For the best forensic analysis experience, please run this application on Linux.
     
     def _install_windows_tools(self):
         """Install tools available on Windows."""
+        from tkinter import Toplevel, Label, Text, Button
+        from tkinter import BOTH, END
+        
         dialog = Toplevel(self.parent)
         dialog.title("Windows Tool Installation")
         dialog.geometry("500x400")
@@ -501,24 +751,34 @@ For the best forensic analysis experience, please run this application on Linux.
         log_text = Text(dialog, height=20)
         log_text.pack(fill=BOTH, expand=True, padx=10, pady=10)
         
+        ui_queue = queue.Queue()
+        
+        def pump():
+            try:
+                while True:
+                    log_text.insert(END, ui_queue.get_nowait())
+                    log_text.see(END)
+            except queue.Empty:
+                pass
+            
+            if dialog.winfo_exists():
+                dialog.after(UI_POLL_INTERVAL_MS, pump)
+        
         def install_windows_thread():
             windows_tools = [name for name, info in self.tools.items() 
                            if info.get("windows_available", False)]
             
             for tool_name in windows_tools:
-                log_text.insert(END, f"Installing {self.tools[tool_name]['name']}...\n")
-                log_text.see(END)
-                dialog.update()
+                ui_queue.put(f"Installing {self.tools[tool_name]['name']}...\n")
                 
                 success, message = self.install_tool(tool_name)
-                log_text.insert(END, f"  {message}\n")
-                log_text.see(END)
-                dialog.update()
+                ui_queue.put(f"  {message}\n")
             
-            log_text.insert(END, "\nWindows tool installation complete.\n")
-            log_text.insert(END, "Note: For full functionality, consider using Linux.\n")
+            ui_queue.put("\nWindows tool installation complete.\n")
+            ui_queue.put("Note: For full functionality, consider using Linux.\n")
         
         threading.Thread(target=install_windows_thread, daemon=True).start()
+        dialog.after(UI_POLL_INTERVAL_MS, pump)
         
         Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
 
@@ -532,6 +792,12 @@ def check_and_install_tools(parent_window=None):
 if __name__ == "__main__":
     # Test the installer
     installer = ToolInstaller()
+    
+    # DFW_NO_PROBE=1 lists the known tools without probing for them
+    if os.environ.get("DFW_NO_PROBE") == "1":
+        print(list(installer.tools.keys()))
+        sys.exit(0)
+    
     status = installer.get_tool_status()
     
     print("Tool Status:")
@@ -4,13 +4,94 @@ This module handles case files, evidence tracking, and mounted drive persistence
 """
 
 import os
-import json
 import datetime
-import hashlib
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+# Read size for hashing evidence files
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# How long a parsed mount table is reused before /proc is read again
+MOUNT_TABLE_TTL = 1.0
+
+# Octal escapes the kernel uses for whitespace and backslashes in mountinfo
+_MOUNTINFO_ESCAPES = (('\\040', ' '), ('\\011', '\t'), ('\\012', '\n'), ('\\134', '\\'))
+
+
+@contextmanager
+def _open_sequential(file_path: str) -> Iterator[BinaryIO]:
+    """Open a file for a single linear scan.
+    
+    Where posix_fadvise is available the kernel is told to read ahead
+    aggressively, and the file's pages are dropped from the page cache once
+    the scan is done so hashing large images does not evict everything else.
+    """
+    with open(file_path, 'rb') as f:
+        advise = getattr(os, 'posix_fadvise', None)
+        if advise is not None:
+            try:
+                advise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                advise = None
+        try:
+            yield f
+        finally:
+            if advise is not None:
+                try:
+                    advise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass
+
+
+class _SafeNameTable(dict):
+    """str.translate() table keeping alphanumerics, spaces, '-' and '_'.
+    
+    Entries are filled in on first use so any Unicode letter or digit is
+    kept, matching str.isalnum().
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in ' -_' else None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    import json
+    
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, using orjson when it is installed.
+    
+    Dataclass instances are serialized as dictionaries.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    import json
+    
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, default=asdict)
+
 
 @dataclass
 class MountedDrive:
@@ -61,8 +142,10 @@ class CaseInfo:
     def __post_init__(self):
         if self.case_id is None:
             # Generate unique case ID
+            import hashlib
+            
             data = f"{self.case_name}{self.case_number}{self.date_created}"
-            self.case_id = hashlib.md5(data.encode()).hexdigest()[:8]
+            self.case_id = hashlib.blake2b(data.encode(), digest_size=4).hexdigest()
 
 
 class CaseManager:
@@ -84,8 +167,24 @@ class CaseManager:
         
         self.current_case_path: Optional[Path] = None
         self.case_info: Optional[CaseInfo] = None
-        self.evidence_items: List[EvidenceItem] = []
-        self.mounted_drives: List[MountedDrive] = []
+        # Keyed by evidence path and mount point respectively
+        self.evidence_items: Dict[str, EvidenceItem] = {}
+        self.mounted_drives: Dict[str, MountedDrive] = {}
+        
+        # Unsaved changes and nesting depth of batch() blocks
+        self._dirty = False
+        self._batch_depth = 0
+        
+        # case_info last written to case_summary.json
+        self._saved_summary: Optional[Dict[str, Any]] = None
+        
+        # (timestamp, mount points) from the last mount table read
+        self._mount_table: Optional[Tuple[float, frozenset]] = None
+        
+        # Known file hashes for the current case, loaded on first use; the
+        # lock guards the dict and hashes.json, which worker threads share
+        self._hash_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._hash_lock = threading.Lock()
         
     def create_new_case(self, case_info: CaseInfo) -> str:
         """Create a new forensic case.
@@ -101,7 +200,7 @@ class CaseManager:
             OSError: If case directory cannot be created
         """
         # Create case directory name
-        safe_name = "".join(c for c in case_info.case_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        safe_name = case_info.case_name.translate(_SAFE_NAME_TABLE).rstrip()
         case_dir_name = f"{safe_name}_{case_info.case_id}"
         case_path = self.case_directory / case_dir_name
         
@@ -120,8 +219,11 @@ class CaseManager:
             # Initialize case
             self.current_case_path = case_path
             self.case_info = case_info
-            self.evidence_items = []
-            self.mounted_drives = []
+            self._saved_summary = None
+            with self._hash_lock:
+                self._hash_cache = None
+            self.evidence_items = {}
+            self.mounted_drives = {}
             
             # Save case file
             self.save_case()
@@ -153,8 +255,7 @@ class CaseManager:
             return False
         
         try:
-            with open(case_file, 'r') as f:
-                case_data = json.load(f)
+            case_data = _read_json(case_file)
             
             # Validate case file version
             if case_data.get('version') != self.CASE_FILE_VERSION:
@@ -164,22 +265,37 @@ class CaseManager:
             self.case_info = CaseInfo(**case_data['case_info'])
             
             # Load evidence items
-            self.evidence_items = [EvidenceItem(**item) for item in case_data.get('evidence_items', [])]
+            self.evidence_items = {}
+            for item in case_data.get('evidence_items', []):
+                evidence = EvidenceItem(**item)
+                self.evidence_items[evidence.path] = evidence
             
             # Load mounted drives
-            self.mounted_drives = [MountedDrive(**drive) for drive in case_data.get('mounted_drives', [])]
+            self.mounted_drives = {}
+            for drive in case_data.get('mounted_drives', []):
+                mounted_drive = MountedDrive(**drive)
+                self.mounted_drives[mounted_drive.mount_point] = mounted_drive
             
             self.current_case_path = case_path
+            self._dirty = False
+            self._saved_summary = None
+            with self._hash_lock:
+                self._hash_cache = None
             
             return True
             
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (ValueError, KeyError, TypeError) as e:
             print(f"Error loading case file: {e}")
             return False
     
     def save_case(self) -> bool:
         """Save current case to file.
         
+        The case file is written to a temporary file first and then moved
+        into place, so an interrupted save never leaves a truncated case.json.
+        A small case_summary.json holding only the case info is kept next to
+        it for list_cases(), and rewritten only when the case info changes.
+        
         Returns:
             True if saved successfully, False otherwise
         """
@@ -187,25 +303,57 @@ class CaseManager:
             return False
         
         case_file = self.current_case_path / "case.json"
+        tmp_file = case_file.with_name("case.json.tmp")
         
         try:
             case_data = {
                 'version': self.CASE_FILE_VERSION,
-                'case_info': asdict(self.case_info),
-                'evidence_items': [asdict(item) for item in self.evidence_items],
-                'mounted_drives': [asdict(drive) for drive in self.mounted_drives],
+                'case_info': self.case_info,
+                'evidence_items': list(self.evidence_items.values()),
+                'mounted_drives': list(self.mounted_drives.values()),
                 'last_modified': datetime.datetime.now().isoformat()
             }
             
-            with open(case_file, 'w') as f:
-                json.dump(case_data, f, indent=2)
+            _write_json(tmp_file, case_data)
+            os.replace(tmp_file, case_file)
+            
+            summary = asdict(self.case_info)
+            if summary != self._saved_summary:
+                summary_file = self.current_case_path / "case_summary.json"
+                tmp_file = summary_file.with_name("case_summary.json.tmp")
+                _write_json(tmp_file, {'version': self.CASE_FILE_VERSION, 'case_info': summary})
+                os.replace(tmp_file, summary_file)
+                self._saved_summary = summary
             
+            self._dirty = False
             return True
             
-        except (OSError, json.JSONEncodeError) as e:
+        except (OSError, TypeError, ValueError) as e:
             print(f"Error saving case file: {e}")
             return False
     
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several case modifications into a single save.
+        
+        Inside the block add_/remove_ calls only mark the case as modified;
+        the case file is written once when the outermost block exits, and
+        not at all if nothing changed.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.save_case()
+    
+    def _mark_dirty(self) -> None:
+        """Record a modification, saving immediately unless batching."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.save_case()
+    
     def add_evidence_item(self, evidence: EvidenceItem) -> bool:
         """Add evidence item to case.
         
@@ -217,12 +365,11 @@ class CaseManager:
         """
         try:
             # Check if evidence already exists
-            for existing in self.evidence_items:
-                if existing.path == evidence.path:
-                    return False
+            if evidence.path in self.evidence_items:
+                return False
             
-            self.evidence_items.append(evidence)
-            self.save_case()
+            self.evidence_items[evidence.path] = evidence
+            self._mark_dirty()
             return True
             
         except Exception as e:
@@ -239,8 +386,8 @@ class CaseManager:
             True if removed successfully, False otherwise
         """
         try:
-            self.evidence_items = [item for item in self.evidence_items if item.path != evidence_path]
-            self.save_case()
+            if self.evidence_items.pop(evidence_path, None) is not None:
+                self._mark_dirty()
             return True
             
         except Exception as e:
@@ -257,14 +404,10 @@ class CaseManager:
             True if added successfully, False otherwise
         """
         try:
-            # Remove existing mount for same image/mount point
-            self.mounted_drives = [
-                drive for drive in self.mounted_drives 
-                if drive.image_path != mounted_drive.image_path or drive.mount_point != mounted_drive.mount_point
-            ]
-            
-            self.mounted_drives.append(mounted_drive)
-            self.save_case()
+            # Replace any existing mount at the same mount point (newest last)
+            self.mounted_drives.pop(mounted_drive.mount_point, None)
+            self.mounted_drives[mounted_drive.mount_point] = mounted_drive
+            self._mark_dirty()
             return True
             
         except Exception as e:
@@ -281,8 +424,8 @@ class CaseManager:
             True if removed successfully, False otherwise
         """
         try:
-            self.mounted_drives = [drive for drive in self.mounted_drives if drive.mount_point != mount_point]
-            self.save_case()
+            if self.mounted_drives.pop(mount_point, None) is not None:
+                self._mark_dirty()
             return True
             
         except Exception as e:
@@ -295,7 +438,7 @@ class CaseManager:
         Returns:
             List of mounted drives
         """
-        return self.mounted_drives.copy()
+        return list(self.mounted_drives.values())
     
     def get_evidence_items(self) -> List[EvidenceItem]:
         """Get list of evidence items for current case.
@@ -303,7 +446,7 @@ class CaseManager:
         Returns:
             List of evidence items
         """
-        return self.evidence_items.copy()
+        return list(self.evidence_items.values())
     
     def is_drive_mounted(self, mount_point: str) -> bool:
         """Check if a drive is currently mounted at the specified point.
@@ -317,19 +460,45 @@ class CaseManager:
         if not os.path.exists(mount_point):
             return False
         
+        mounts = self._get_mount_points()
+        if mounts is not None:
+            return os.path.realpath(mount_point) in mounts
+        
+        # No mount table (e.g. macOS): compare the device with the parent's
+        return os.path.ismount(mount_point)
+    
+    def _get_mount_points(self) -> Optional[frozenset]:
+        """Get the set of active mount points from /proc/self/mountinfo.
+        
+        The parsed table is reused for MOUNT_TABLE_TTL seconds so repeated
+        checks (validating every drive in a case, GUI refreshes) read and
+        parse it only once.
+        
+        Returns:
+            Set of mount point paths, or None if no mount table is available
+        """
+        now = time.monotonic()
+        if self._mount_table is not None and now - self._mount_table[0] < MOUNT_TABLE_TTL:
+            return self._mount_table[1]
+        
         try:
-            # Check if mount point is actually mounted
-            with open('/proc/mounts', 'r') as f:
-                mounts = f.read()
-            
-            return mount_point in mounts
-            
-        except Exception:
-            # Fallback: check if directory is not empty
-            try:
-                return len(os.listdir(mount_point)) > 0
-            except Exception:
-                return False
+            with open('/proc/self/mountinfo', 'r') as f:
+                points = []
+                for line in f:
+                    fields = line.split(' ', 5)
+                    if len(fields) < 5:
+                        continue
+                    point = fields[4]
+                    if '\\' in point:
+                        for escape, char in _MOUNTINFO_ESCAPES:
+                            point = point.replace(escape, char)
+                    points.append(point)
+        except OSError:
+            return None
+        
+        mounts = frozenset(points)
+        self._mount_table = (now, mounts)
+        return mounts
     
     def validate_mounted_drives(self) -> List[MountedDrive]:
         """Validate all mounted drives and return list of valid ones.
@@ -339,7 +508,7 @@ class CaseManager:
         """
         valid_drives = []
         
-        for drive in self.mounted_drives:
+        for drive in self.mounted_drives.values():
             if self.is_drive_mounted(drive.mount_point):
                 valid_drives.append(drive)
         
@@ -367,6 +536,9 @@ class CaseManager:
     def list_cases(self) -> List[Dict[str, str]]:
         """List all available cases.
         
+        Reads each case's case_summary.json, falling back to the full
+        case.json for cases saved before summaries were written.
+        
         Returns:
             List of case information dictionaries
         """
@@ -375,11 +547,12 @@ class CaseManager:
         try:
             for case_dir in self.case_directory.iterdir():
                 if case_dir.is_dir():
-                    case_file = case_dir / "case.json"
+                    case_file = case_dir / "case_summary.json"
+                    if not case_file.exists():
+                        case_file = case_dir / "case.json"
                     if case_file.exists():
                         try:
-                            with open(case_file, 'r') as f:
-                                case_data = json.load(f)
+                            case_data = _read_json(case_file)
                             
                             case_info = case_data.get('case_info', {})
                             cases.append({
@@ -404,17 +577,27 @@ class CaseManager:
         
         Args:
             file_path: Path to file
-            algorithm: Hash algorithm ('md5', 'sha1', 'sha256')
+            algorithm: Hash algorithm ('md5', 'sha1', 'sha256', 'blake2b')
             
         Returns:
             Hex digest of hash, or None if error
         """
+        import hashlib
+        
         try:
-            hash_obj = hashlib.new(algorithm)
-            
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_obj.update(chunk)
+            with _open_sequential(file_path) as f:
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: the read/update loop runs entirely in C
+                    return hashlib.file_digest(f, algorithm).hexdigest()
+                
+                hash_obj = hashlib.new(algorithm)
+                buf = bytearray(HASH_CHUNK_SIZE)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    hash_obj.update(view[:n])
             
             return hash_obj.hexdigest()
             
@@ -422,6 +605,114 @@ class CaseManager:
             print(f"Error calculating hash: {e}")
             return None
     
+    def calculate_file_hashes(self, file_path: str,
+                              algorithms: Tuple[str, ...] = ('md5', 'sha1', 'sha256')) -> Optional[Dict[str, str]]:
+        """Calculate several hashes of a file in a single read pass.
+        
+        Args:
+            file_path: Path to file
+            algorithms: Hash algorithm names accepted by hashlib.new()
+            
+        Returns:
+            Dictionary mapping algorithm name to hex digest, or None if error
+        """
+        import hashlib
+        
+        try:
+            hashers = [(name, hashlib.new(name)) for name in algorithms]
+            buf = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            
+            with _open_sequential(file_path) as f:
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    chunk = view[:n]
+                    for _, hash_obj in hashers:
+                        hash_obj.update(chunk)
+            
+            return {name: hash_obj.hexdigest() for name, hash_obj in hashers}
+            
+        except Exception as e:
+            print(f"Error calculating hashes: {e}")
+            return None
+    
+    def cached_file_hashes(self, file_path: str,
+                           algorithms: Tuple[str, ...] = ('md5', 'sha1', 'sha256')) -> Optional[Dict[str, str]]:
+        """Return file hashes, reusing earlier results for unchanged files.
+        
+        Digests are remembered per file together with its size and
+        modification time, and saved to hashes.json in the case directory so
+        they survive reopening the case. A file whose size or mtime changed
+        is hashed again. Changes that keep both go unnoticed, so use
+        calculate_file_hashes wherever the hash verifies or records evidence
+        integrity. Safe to call from worker threads.
+        
+        Args:
+            file_path: Path to file
+            algorithms: Hash algorithm names accepted by hashlib.new()
+            
+        Returns:
+            Dictionary mapping algorithm name to hex digest, or None if error
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError as e:
+            print(f"Error calculating hashes: {e}")
+            return None
+        
+        key = os.path.abspath(file_path)
+        with self._hash_lock:
+            entry = self._load_hash_cache().get(key)
+            if entry is None or entry['size'] != st.st_size or entry['mtime_ns'] != st.st_mtime_ns:
+                known: Dict[str, str] = {}
+            else:
+                known = dict(entry['hashes'])
+        
+        # Hash outside the lock so other files can be looked up meanwhile
+        missing = tuple(name for name in algorithms if name not in known)
+        if missing:
+            hashes = self.calculate_file_hashes(file_path, missing)
+            if hashes is None:
+                return None
+            known.update(hashes)
+            with self._hash_lock:
+                self._load_hash_cache()[key] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'hashes': known}
+                self._save_hash_cache()
+        
+        return {name: known[name] for name in algorithms}
+    
+    def _load_hash_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Return the hash cache, reading hashes.json the first time.
+        
+        Must be called with _hash_lock held.
+        """
+        if self._hash_cache is None:
+            self._hash_cache = {}
+            if self.current_case_path:
+                try:
+                    self._hash_cache = _read_json(self.current_case_path / "hashes.json")
+                except (OSError, ValueError):
+                    pass
+        return self._hash_cache
+    
+    def _save_hash_cache(self) -> None:
+        """Write the hash cache to hashes.json in the case directory.
+        
+        Must be called with _hash_lock held. The file is replaced
+        atomically, like case.json.
+        """
+        if not self.current_case_path:
+            return
+        cache_file = self.current_case_path / "hashes.json"
+        tmp_file = cache_file.with_name("hashes.json.tmp")
+        try:
+            _write_json(tmp_file, self._hash_cache)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Error saving hash cache: {e}")
+    
     def export_case_info(self, export_path: str) -> bool:
         """Export case information to JSON file.
         
@@ -434,8 +725,7 @@ class CaseManager:
         try:
             case_summary = self.get_case_summary()
             
-            with open(export_path, 'w') as f:
-                json.dump(case_summary, f, indent=2)
+            _write_json(Path(export_path), case_summary)
             
             return True
             
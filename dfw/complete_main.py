@@ -5,6 +5,7 @@ a comprehensive forensic analysis platform.
 """
 
 import os
+import re
 import sys
 import platform
 import json
@@ -16,11 +17,11 @@ import shutil
 from pathlib import Path
 from tkinter import *
 from tkinter import ttk, messagebox, filedialog
-from typing import Optional, Dict, List, Any
+from typing import Callable, Optional, Dict, Iterable, List, Any, Sequence
 import webbrowser
 
 # Import all our modules
-from . import env, mount, keywords, forensic_tools
+from . import env, mount, keywords, forensic_tools, carver
 from .os_detector import OSDetector, OSType
 from .browser_forensics import BrowserForensics
 from .registry_analyzer import RegistryAnalyzer
@@ -29,6 +30,37 @@ from .notes_terminal import CaseNotesManager, NotesTab, EmbeddedTerminal
 from .auto_installer import ToolInstaller, check_and_install_tools
 from .case_manager import CaseManager, CaseInfo, EvidenceItem, MountedDrive
 from .error_handler import error_handler_instance, setup_global_exception_handler, error_handler
+from .utils import copy_file, hexdump, iter_image_chunks, tree_hash, format_bytes
+from .virtual_tree import VirtualFileTree, VirtualTreeview
+
+try:
+    import yara  # type: ignore
+except ImportError:
+    yara = None  # type: ignore
+
+# Compiled YARA rule bundles, named by the SHA-256 of their source
+YARA_CACHE_DIR = Path.home() / ".dfw" / "yara_cache"
+
+# Separators between search keywords: commas, semicolons, whitespace
+_KEYWORD_SEPARATOR_RE = re.compile(r'[,;\s]+')
+
+# Characters not allowed in new directory names
+_UNSAFE_DIR_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+# File browser icons by lowercase extension; anything else gets a page
+_EXT_ICON = {
+    '.txt': "📄", '.log': "📄", '.ini': "📄", '.cfg': "📄",
+    '.exe': "⚙️", '.dll': "⚙️", '.sys': "⚙️",
+    '.jpg': "🖼️", '.png': "🖼️", '.gif': "🖼️", '.bmp': "🖼️",
+    '.mp3': "🎵", '.wav': "🎵", '.mp4': "🎵", '.avi': "🎵",
+}
+
+# Tcl lambda run by _bulk_insert: inserts every item in one interpreter call
+_BULK_INSERT_TCL = """{tree parent items} {
+    foreach {text values} $items {
+        $tree insert $parent end -text $text -values $values
+    }
+}"""
 
 
 class CompleteDFW(Tk):
@@ -59,6 +91,11 @@ class CompleteDFW(Tk):
         self.current_mount_point = None
         self.detected_os = None
         self.evidence_items = {}
+        self._yara_rules_cache: Dict[str, Any] = {}
+
+        # Latest status message and whether a repaint is already queued
+        self._status_message = ""
+        self._status_pending = False
 
         # Create UI
         self._create_menu()
@@ -146,23 +183,76 @@ class CompleteDFW(Tk):
         self.notebook = ttk.Notebook(right_panel)
         self.notebook.pack(fill=BOTH, expand=True)
 
-        # Create all tabs
-        self._create_case_tab()
-        self._create_mount_tab()
-        self._create_browser_tab()
-        self._create_registry_tab()
-        self._create_timeline_tab()
-        self._create_search_tab()
-        self._create_memory_tab()
-        self._create_network_tab()
-        self._create_mobile_tab()
-        self._create_notes_tab()
-        self._create_terminal_tab()
-        self._create_report_tab()
+        # Create all tabs. Only the tabs other code relies on from startup
+        # are built now; the rest get their widgets the first time they
+        # are shown (or _ensure_tab is called for them).
+        self._tab_builders: Dict[str, Callable[[Frame], None]] = {}
+        self._add_tab("Case Info", self._create_case_tab, lazy=False)
+        self._add_tab("Mount/Extract", self._create_mount_tab, lazy=False)
+        self._add_tab("Browser", self._create_browser_tab)
+        self._add_tab("Registry", self._create_registry_tab)
+        self._add_tab("Timeline", self._create_timeline_tab)
+        self._add_tab("Search", self._create_search_tab)
+        self._add_tab("Memory", self._create_memory_tab)
+        self._add_tab("Network", self._create_network_tab)
+        self._add_tab("Mobile", self._create_mobile_tab)
+        self._add_tab("Notes", self._create_notes_tab, lazy=False)
+        self._add_tab("Terminal", self._create_terminal_tab)
+        self._add_tab("Report", self._create_report_tab)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Status bar
         self._create_status_bar()
 
+    def _add_tab(self, text: str, builder: Callable[[Frame], None], lazy: bool = True) -> None:
+        """Add a notebook tab whose contents are built by builder.
+
+        Args:
+            text: Tab label
+            builder: Method that fills the tab's frame with its widgets
+            lazy: Defer building until the tab is first needed
+        """
+        frame = Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        if lazy:
+            self._tab_builders[str(frame)] = builder
+        else:
+            builder(frame)
+
+    def _on_tab_changed(self, event=None) -> None:
+        """Build the selected tab if this is the first time it is shown."""
+        if not self._tab_builders:
+            return
+        tab_id = self.notebook.select()
+        builder = self._tab_builders.pop(tab_id, None)
+        if builder is not None:
+            builder(self.nametowidget(tab_id))
+
+    def _ensure_tab(self, builder: Callable[[Frame], None]) -> None:
+        """Build a lazy tab now if it has not been built yet.
+
+        Call this before touching a tab's widgets from outside the tab
+        (menu actions, reports).
+
+        Args:
+            builder: The tab's _create_*_tab method
+        """
+        for tab_id, pending in self._tab_builders.items():
+            if pending == builder:
+                del self._tab_builders[tab_id]
+                builder(self.nametowidget(tab_id))
+                return
+
+    def _set_search_dir(self, path: str) -> None:
+        """Pre-fill the search directory, if the Search tab exists yet.
+
+        An unbuilt Search tab picks up the current mount point when built.
+        """
+        if not hasattr(self, 'search_dir'):
+            return
+        self.search_dir.delete(0, END)
+        self.search_dir.insert(0, path)
+
     def _create_evidence_panel(self, parent):
         """Create evidence tree panel."""
         left_panel = Frame(parent, width=250)
@@ -247,9 +337,9 @@ class CompleteDFW(Tk):
         file_tree_scrollbar_h = ttk.Scrollbar(file_tree_frame, orient=HORIZONTAL)
         file_tree_scrollbar_h.pack(side=BOTTOM, fill=X)
 
-        self.file_tree = ttk.Treeview(file_tree_frame, show='tree', 
-                                     yscrollcommand=file_tree_scrollbar_v.set,
-                                     xscrollcommand=file_tree_scrollbar_h.set)
+        self.file_tree = VirtualFileTree(file_tree_frame, lister=self._file_tree_rows,
+                                         yscrollcommand=file_tree_scrollbar_v.set,
+                                         xscrollcommand=file_tree_scrollbar_h.set)
         self.file_tree.pack(side=LEFT, fill=BOTH, expand=True)
         
         file_tree_scrollbar_v.config(command=self.file_tree.yview)
@@ -261,10 +351,8 @@ class CompleteDFW(Tk):
         # Initialize tree
         self.case_node = self.evidence_tree.insert('', 'end', text='Current Case', open=True)
 
-    def _create_case_tab(self):
+    def _create_case_tab(self, frame: Frame):
         """Create case information tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Case Info")
 
         # Case details
         details_frame = ttk.LabelFrame(frame, text="Case Details", padding=10)
@@ -316,15 +404,14 @@ class CompleteDFW(Tk):
         self.env_text = Text(env_frame, height=10)
         self.env_text.pack(fill=BOTH, expand=True)
 
-        Button(env_frame, text="Refresh", command=self._check_environment).pack(pady=5)
+        Button(env_frame, text="Refresh",
+               command=lambda: self._check_environment(use_cache=False)).pack(pady=5)
 
         frame.grid_rowconfigure(2, weight=1)
         frame.grid_columnconfigure(1, weight=1)
 
-    def _create_mount_tab(self):
+    def _create_mount_tab(self, frame: Frame):
         """Create mount/extract tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Mount/Extract")
 
         # Image selection
         img_frame = ttk.LabelFrame(frame, text="Disk Image", padding=10)
@@ -335,6 +422,7 @@ class CompleteDFW(Tk):
         self.image_path.grid(row=0, column=1, sticky='ew')
         Button(img_frame, text="Browse", command=self._browse_image).grid(row=0, column=2)
         Button(img_frame, text="Calculate Hash", command=self._calc_image_hash).grid(row=0, column=3)
+        Button(img_frame, text="Tree Hash", command=self._calc_image_tree_hash).grid(row=0, column=4)
 
         # Hash display
         self.hash_label = Label(img_frame, text="", fg='blue')
@@ -380,10 +468,8 @@ class CompleteDFW(Tk):
         Button(mount_frame, text="Extract", command=self._extract_image).grid(row=3, column=2, pady=5)
         Button(mount_frame, text="Unmount", command=self._unmount_image).grid(row=3, column=3, pady=5)
 
-    def _create_browser_tab(self):
+    def _create_browser_tab(self, frame: Frame):
         """Create browser forensics tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Browser")
 
         # Controls
         control_frame = Frame(frame)
@@ -418,10 +504,8 @@ class CompleteDFW(Tk):
             self.downloads_tree.heading(col, text=col)
         self.downloads_tree.pack(fill=BOTH, expand=True)
 
-    def _create_registry_tab(self):
+    def _create_registry_tab(self, frame: Frame):
         """Create registry analysis tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Registry")
 
         # Controls
         control_frame = Frame(frame)
@@ -438,10 +522,8 @@ class CompleteDFW(Tk):
         self.registry_text = Text(frame)
         self.registry_text.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
-    def _create_timeline_tab(self):
+    def _create_timeline_tab(self, frame: Frame):
         """Create timeline tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Timeline")
 
         # Controls
         control_frame = ttk.LabelFrame(frame, text="Timeline Options", padding=10)
@@ -454,17 +536,18 @@ class CompleteDFW(Tk):
         Button(control_frame, text="Export Timeline",
                command=self._export_timeline).pack(side=LEFT, padx=2)
 
-        # Timeline display
+        # Timeline display (virtual: super timelines can run to millions of rows)
         columns = ('Timestamp', 'Source', 'Event', 'Details')
-        self.timeline_tree = ttk.Treeview(frame, columns=columns, show='headings')
+        self.timeline_tree = VirtualTreeview(frame, columns=columns)
         for col in columns:
             self.timeline_tree.heading(col, text=col)
+        timeline_scroll = ttk.Scrollbar(frame, orient=VERTICAL, command=self.timeline_tree.yview)
+        self.timeline_tree.configure(yscrollcommand=timeline_scroll.set)
+        timeline_scroll.pack(side=RIGHT, fill=Y, pady=5)
         self.timeline_tree.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
-    def _create_search_tab(self):
+    def _create_search_tab(self, frame: Frame):
         """Create search tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Search")
 
         # Search options
         search_frame = ttk.LabelFrame(frame, text="Search Options", padding=10)
@@ -473,6 +556,8 @@ class CompleteDFW(Tk):
         Label(search_frame, text="Directory:").grid(row=0, column=0, sticky='w')
         self.search_dir = Entry(search_frame, width=50)
         self.search_dir.grid(row=0, column=1)
+        if self.current_mount_point:
+            self.search_dir.insert(0, self.current_mount_point)
         Button(search_frame, text="Browse", command=self._browse_search_dir).grid(row=0, column=2)
 
         Label(search_frame, text="Keywords:").grid(row=1, column=0, sticky='w')
@@ -484,15 +569,16 @@ class CompleteDFW(Tk):
 
         # Search results
         columns = ('File', 'Line', 'Context')
-        self.search_tree = ttk.Treeview(frame, columns=columns, show='headings')
+        self.search_tree = VirtualTreeview(frame, columns=columns)
         for col in columns:
             self.search_tree.heading(col, text=col)
+        search_scroll = ttk.Scrollbar(frame, orient=VERTICAL, command=self.search_tree.yview)
+        self.search_tree.configure(yscrollcommand=search_scroll.set)
+        search_scroll.pack(side=RIGHT, fill=Y, pady=5)
         self.search_tree.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
-    def _create_memory_tab(self):
+    def _create_memory_tab(self, frame: Frame):
         """Create memory analysis tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Memory")
 
         # Controls
         control_frame = ttk.LabelFrame(frame, text="Memory Image", padding=10)
@@ -514,10 +600,8 @@ class CompleteDFW(Tk):
         self.memory_text = Text(frame)
         self.memory_text.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
-    def _create_network_tab(self):
+    def _create_network_tab(self, frame: Frame):
         """Create network analysis tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Network")
 
         # Controls
         control_frame = ttk.LabelFrame(frame, text="PCAP Analysis", padding=10)
@@ -535,10 +619,8 @@ class CompleteDFW(Tk):
         self.network_text = Text(frame)
         self.network_text.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
-    def _create_mobile_tab(self):
+    def _create_mobile_tab(self, frame: Frame):
         """Create mobile forensics tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Mobile")
 
         # Controls
         control_frame = ttk.LabelFrame(frame, text="Mobile Data", padding=10)
@@ -556,26 +638,20 @@ class CompleteDFW(Tk):
         self.mobile_text = Text(frame)
         self.mobile_text.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
-    def _create_notes_tab(self):
+    def _create_notes_tab(self, frame: Frame):
         """Create case notes tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Notes")
 
         self.notes_widget = NotesTab(frame, self.notes_manager)
         self.notes_widget.pack(fill=BOTH, expand=True)
 
-    def _create_terminal_tab(self):
+    def _create_terminal_tab(self, frame: Frame):
         """Create embedded terminal tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Terminal")
 
         self.terminal_widget = EmbeddedTerminal(frame)
         self.terminal_widget.pack(fill=BOTH, expand=True)
 
-    def _create_report_tab(self):
+    def _create_report_tab(self, frame: Frame):
         """Create report generation tab."""
-        frame = Frame(self.notebook)
-        self.notebook.add(frame, text="Report")
 
         # Report options
         report_frame = ttk.LabelFrame(frame, text="Report Options", padding=10)
@@ -612,10 +688,44 @@ class CompleteDFW(Tk):
         self.progress.pack(side=RIGHT, padx=5)
 
     # Implementation methods
-    def set_status(self, message: str):
-        """Update status bar."""
-        self.status_label.config(text=message)
-        self.update_idletasks()
+    def _bulk_insert(self, tree: ttk.Treeview, parent: str, items: List[tuple]) -> None:
+        """Insert many children under a tree node with one Tcl call.
+
+        The items are handed to Tcl as a single list and inserted by a
+        Tcl loop, instead of one Python-to-Tcl round trip per row. Values
+        travel as Tcl lists, so names need no escaping.
+
+        Args:
+            tree: Treeview holding parent
+            parent: Node to insert under ('' for the top level)
+            items: (text, values) tuples, one per child
+        """
+        flat: List[Any] = []
+        for text, values in items:
+            flat.extend((text, tuple(values)))
+        if flat:
+            tree.tk.call('apply', _BULK_INSERT_TCL, str(tree), parent, tuple(flat))
+
+    def _fill_tree(self, tree: ttk.Treeview, rows: Iterable[Sequence[Any]]) -> None:
+        """Replace all top-level rows of a treeview.
+
+        Rows are formatted by the caller up front so the Tk work is one
+        delete of the old items followed by a single bulk insert.
+
+        Args:
+            tree: Treeview to fill
+            rows: Value sequences, one per row; a virtual treeview consumes
+                them as an iterator, so they need not be held in memory
+        """
+        if isinstance(tree, VirtualTreeview):
+            tree.set_rows(rows)
+            return
+
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+
+        self._bulk_insert(tree, '', [('', values) for values in rows])
 
     # Case Management Methods
     def _initialize_or_load_case(self):
@@ -928,15 +1038,16 @@ class CompleteDFW(Tk):
                 )
                 
                 if result:
-                    for mount_point in existing_mounts:
-                        # Create a mounted drive entry
-                        mounted_drive = MountedDrive(
-                            image_path="Unknown",
-                            mount_point=mount_point,
-                            readonly=True,
-                            mount_time=datetime.datetime.now().isoformat()
-                        )
-                        self.case_manager.add_mounted_drive(mounted_drive)
+                    with self.case_manager.batch():
+                        for mount_point in existing_mounts:
+                            # Create a mounted drive entry
+                            mounted_drive = MountedDrive(
+                                image_path="Unknown",
+                                mount_point=mount_point,
+                                readonly=True,
+                                mount_time=datetime.datetime.now().isoformat()
+                            )
+                            self.case_manager.add_mounted_drive(mounted_drive)
                     
                     self._refresh_mounted_drives()
                     messagebox.showinfo("Success", f"Added {len(existing_mounts)} mounted drives to case")
@@ -978,8 +1089,7 @@ class CompleteDFW(Tk):
                     self._refresh_file_tree()
                     
                     # Auto-populate search directory
-                    self.search_dir.delete(0, END)
-                    self.search_dir.insert(0, self.current_mount_point)
+                    self._set_search_dir(self.current_mount_point)
             
             self._refresh_mounted_drives()
             
@@ -1021,8 +1131,7 @@ class CompleteDFW(Tk):
                 self._refresh_file_tree()
                 
                 # Auto-populate search directory
-                self.search_dir.delete(0, END)
-                self.search_dir.insert(0, mount_point)
+                self._set_search_dir(mount_point)
                 
                 self.set_status(f"Selected mounted drive: {mount_point}")
 
@@ -1050,8 +1159,7 @@ class CompleteDFW(Tk):
                 self._refresh_file_tree()
                 
                 # Auto-populate search directory
-                self.search_dir.delete(0, END)
-                self.search_dir.insert(0, mount_point)
+                self._set_search_dir(mount_point)
                 
                 messagebox.showinfo("Success", f"Added mounted drive: {mount_point}")
             else:
@@ -1060,15 +1168,17 @@ class CompleteDFW(Tk):
     def _refresh_evidence_tree(self):
         """Refresh the evidence tree."""
         # Clear existing evidence items (keep case node)
-        for item in self.evidence_tree.get_children(self.case_node):
-            self.evidence_tree.delete(item)
+        children = self.evidence_tree.get_children(self.case_node)
+        if children:
+            self.evidence_tree.delete(*children)
         
         try:
             evidence_items = self.case_manager.get_evidence_items()
             
-            for evidence in evidence_items:
-                display_name = f"{evidence.name} ({evidence.item_type})"
-                self.evidence_tree.insert(self.case_node, 'end', text=display_name, values=[evidence.path])
+            self._bulk_insert(self.evidence_tree, self.case_node, [
+                (f"{evidence.name} ({evidence.item_type})", [evidence.path])
+                for evidence in evidence_items
+            ])
                 
         except Exception as e:
             print(f"Error refreshing evidence tree: {e}")
@@ -1092,30 +1202,45 @@ class CompleteDFW(Tk):
         self.case_vars["investigator"].insert(0, os.getenv("USER", "Investigator"))
         self.case_vars["date_created"].insert(0, datetime.datetime.now().strftime("%Y-%m-%d %H:%M"))
 
-    def _check_environment(self):
-        """Check system environment."""
+    def _check_environment(self, use_cache: bool = True):
+        """Check system environment.
+
+        Detection runs on a worker thread so the window can paint; the
+        report is written to the text widget in one insert afterwards.
+
+        Args:
+            use_cache: Reuse cached tool detection from a previous run
+        """
         self.set_status("Checking environment...")
 
-        # Check Python environment
-        info = env.check_environment()
+        def check():
+            # Check Python environment
+            info = env.check_environment(use_cache=use_cache)
 
-        # Check external tools
-        tools = self.tool_manager.get_available_tools()
+            # Check external tools
+            tools = self.tool_manager.get_available_tools()
 
-        # Display results
-        self.env_text.delete('1.0', END)
-        self.env_text.insert(END, f"OS: {info['os_type']} {info['os_version']}\n")
-        self.env_text.insert(END, f"Python: {sys.version}\n")
-        self.env_text.insert(END, f"WSL: {'Yes' if info.get('is_wsl') else 'No'}\n\n")
+            lines = [
+                f"OS: {info['os_type']} {info['os_version']}\n",
+                f"Python: {sys.version}\n",
+                f"WSL: {'Yes' if info.get('is_wsl') else 'No'}\n\n",
+                "External Tools:\n",
+            ]
+            for category, tool_list in tools.items():
+                lines.append(f"\n{category.upper()}:\n")
+                for tool, available in tool_list.items():
+                    status = "✓" if available else "✗"
+                    lines.append(f"  {status} {tool}\n")
+            report = "".join(lines)
 
-        self.env_text.insert(END, "External Tools:\n")
-        for category, tool_list in tools.items():
-            self.env_text.insert(END, f"\n{category.upper()}:\n")
-            for tool, available in tool_list.items():
-                status = "✓" if available else "✗"
-                self.env_text.insert(END, f"  {status} {tool}\n")
+            def show():
+                self.env_text.delete('1.0', END)
+                self.env_text.insert(END, report)
+                self.set_status("Environment check complete")
 
-        self.set_status("Environment check complete")
+            self.after(0, show)
+
+        threading.Thread(target=check, daemon=True).start()
 
     def _auto_detect_os(self):
         """Auto-detect OS of mounted evidence."""
@@ -1129,8 +1254,13 @@ class CompleteDFW(Tk):
 
         def detect():
             try:
+                case_path = self.case_manager.current_case_path
+                cache_file = str(case_path / "os_detect.json") if case_path else None
+                # Saved results follow the image, not the mount point
+                source = next((drive.image_path for drive in self.case_manager.get_mounted_drives()
+                               if drive.mount_point == self.current_mount_point), None)
                 detector = OSDetector(self.current_mount_point)
-                os_info = detector.detect()
+                os_info = detector.detect(cache_file=cache_file, source=source)
 
                 self.detected_os = os_info
                 self.os_label.config(text=f"{os_info.os_type.value} {os_info.version or ''}")
@@ -1171,25 +1301,28 @@ class CompleteDFW(Tk):
             return
 
         self.set_status("Scanning partitions...")
+        self.flush_status()
 
         # Clear tree
-        for item in self.part_tree.get_children():
-            self.part_tree.delete(item)
+        self._fill_tree(self.part_tree, [])
 
-        # Run mmls
-        result = self.tool_manager.run_mmls(image)
+        # Reads the table in-process with pytsk3 when available, else via mmls
+        partitions = mount.parse_partitions(image)
 
-        if result.success:
-            # Parse output
-            partitions = mount.parse_partitions(image)
-            for p in partitions:
-                size_mb = (p.length * 512) / (1024 * 1024)
-                self.part_tree.insert('', 'end', values=(
-                    p.index, p.start_sector, f"{size_mb:.1f} MB",
-                    "Unknown", p.description
-                ))
+        if partitions:
+            self._fill_tree(self.part_tree, [
+                (p.index, p.start_sector, f"{p.length * 512 / (1024 * 1024):.1f} MB",
+                 "Unknown", p.description)
+                for p in partitions
+            ])
 
             self.set_status(f"Found {len(partitions)} partitions")
+            return
+
+        # Nothing found; run mmls only now, to report why
+        result = self.tool_manager.run_mmls(image)
+        if result.success:
+            self.set_status("Found 0 partitions")
         else:
             messagebox.showerror("Error", result.stderr)
 
@@ -1331,9 +1464,10 @@ class CompleteDFW(Tk):
                 if result.returncode == 0:
                     self.current_mount_point = mount_point
                     
-                    # Calculate image hash for evidence tracking
-                    self.set_status("Calculating image hash...")
-                    image_hash = self.case_manager.calculate_file_hash(image, 'sha256')
+                    # Calculate image hashes for evidence tracking (one read pass)
+                    self.set_status("Calculating image hashes...")
+                    image_hashes = self.case_manager.calculate_file_hashes(image) or {}
+                    image_hash = image_hashes.get('sha256')
                     
                     # Detect file system type
                     fs_type = None
@@ -1368,22 +1502,26 @@ class CompleteDFW(Tk):
                         size_bytes=image_size
                     )
                     
-                    # Add to case with error handling
-                    if not self.case_manager.add_mounted_drive(mounted_drive):
-                        print("Warning: Failed to add mounted drive to case")
-                    
-                    # Add as evidence item if not already present
-                    evidence = EvidenceItem(
-                        name=os.path.basename(image),
-                        path=image,
-                        item_type='disk_image',
-                        hash_sha256=image_hash,
-                        size_bytes=image_size,
-                        description=f"Disk image mounted at {mount_point} with offset {offset if offset > 0 else 0}"
-                    )
-                    
-                    if not self.case_manager.add_evidence_item(evidence):
-                        print("Note: Evidence item already exists in case")
+                    # Record the mount and the image evidence with a single case save
+                    with self.case_manager.batch():
+                        # Add to case with error handling
+                        if not self.case_manager.add_mounted_drive(mounted_drive):
+                            print("Warning: Failed to add mounted drive to case")
+                        
+                        # Add as evidence item if not already present
+                        evidence = EvidenceItem(
+                            name=os.path.basename(image),
+                            path=image,
+                            item_type='disk_image',
+                            hash_md5=image_hashes.get('md5'),
+                            hash_sha1=image_hashes.get('sha1'),
+                            hash_sha256=image_hash,
+                            size_bytes=image_size,
+                            description=f"Disk image mounted at {mount_point} with offset {offset if offset > 0 else 0}"
+                        )
+                        
+                        if not self.case_manager.add_evidence_item(evidence):
+                            print("Note: Evidence item already exists in case")
                     
                     self.set_status(f"Successfully mounted image to {mount_point}")
                     
@@ -1394,8 +1532,7 @@ class CompleteDFW(Tk):
                     
                     # Auto-populate search directory
                     try:
-                        self.search_dir.delete(0, END)
-                        self.search_dir.insert(0, mount_point)
+                        self._set_search_dir(mount_point)
                     except Exception:
                         pass  # Search directory update is optional
                     
@@ -1447,7 +1584,11 @@ class CompleteDFW(Tk):
         threading.Thread(target=mount_thread, daemon=True).start()
 
     def _refresh_file_tree(self):
-        """Refresh the file tree with mounted drive contents."""
+        """Refresh the file tree with mounted drive contents.
+
+        Only the top level of the mount is listed; each directory below is
+        listed when it is first opened (see _file_tree_rows).
+        """
         if not self.current_mount_point:
             messagebox.showwarning("No Mount", "Please mount an image first")
             return
@@ -1457,100 +1598,96 @@ class CompleteDFW(Tk):
             return
         
         # Clear existing tree
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        self.file_tree.clear()
         
         self.set_status("Loading file tree...")
+        mount_point = self.current_mount_point
         
         def load_tree():
+            # The listing runs here; the Tk inserts happen on the Tk thread
             try:
-                # Add root node
-                root_node = self.file_tree.insert('', 'end', text=f"📁 {os.path.basename(self.current_mount_point)}", 
-                                                  values=[self.current_mount_point], open=True)
-                
-                # Load directory contents
-                self._load_directory_tree(self.current_mount_point, root_node)
-                
-                self.set_status(f"File tree loaded from {self.current_mount_point}")
-                
+                items = self._scan_directory(mount_point)
             except Exception as e:
-                self.set_status(f"Error loading file tree: {str(e)}")
-                messagebox.showerror("Error", f"Failed to load file tree:\n{str(e)}")
+                self.after(0, failed, str(e))
+                return
+            self.after(0, show, items)
+        
+        def show(items):
+            self.file_tree.set_root(f"📁 {os.path.basename(mount_point)}", mount_point,
+                                    self._file_tree_rows(mount_point, items))
+            self.set_status(f"File tree loaded from {mount_point}")
+        
+        def failed(message):
+            self.set_status(f"Error loading file tree: {message}")
+            messagebox.showerror("Error", f"Failed to load file tree:\n{message}")
         
         threading.Thread(target=load_tree, daemon=True).start()
 
-    def _load_directory_tree(self, path, parent_node, max_depth=3, current_depth=0):
-        """Recursively load directory tree."""
-        if current_depth >= max_depth:
-            return
+    @staticmethod
+    def _scan_directory(path: str) -> List[tuple]:
+        """List a directory for the file tree.
+
+        Uses os.scandir, whose entries carry the file type from the
+        directory read, so entries need no stat() of their own. Symlinks
+        are not followed: they are listed as leaf entries, which also keeps
+        an absolute link in the evidence from pointing the tree into the
+        examiner's own filesystem.
+
+        Args:
+            path: Directory to list
+
+        Returns:
+            (name, path, is_dir) tuples, directories first, then by name
+        """
+        items = []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    items.append((entry.name, entry.path, entry.is_dir(follow_symlinks=False)))
+                except OSError:
+                    continue
         
+        # Sort: directories first, then files
+        items.sort(key=lambda x: (not x[2], x[0].lower()))
+        return items
+
+    def _file_tree_rows(self, path, items=None):
+        """Build the file tree rows for one level of a directory.
+
+        Every entry is returned; the tree only creates Tk items for the
+        rows on screen, so large directories need no cap.
+
+        Args:
+            path: Directory to list
+            items: Listing from _scan_directory, if already made
+
+        Returns:
+            (text, path, is_dir) tuples for VirtualFileTree
+        """
         try:
-            items = []
-            # Get directory contents
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path):
-                    items.append((item, item_path, True))  # Directory
-                elif os.path.isfile(item_path):
-                    items.append((item, item_path, False))  # File
-            
-            # Sort: directories first, then files
-            items.sort(key=lambda x: (not x[2], x[0].lower()))
-            
-            # Add items to tree (limit to prevent UI freeze)
-            for i, (item_name, item_path, is_dir) in enumerate(items[:100]):  # Limit to 100 items per directory
-                if is_dir:
-                    icon = "📁"
-                    node = self.file_tree.insert(parent_node, 'end', text=f"{icon} {item_name}", 
-                                                 values=[item_path], open=False)
-                    
-                    # Add placeholder for lazy loading
-                    self.file_tree.insert(node, 'end', text="Loading...", values=[""])
-                else:
-                    # Determine file icon
-                    ext = os.path.splitext(item_name)[1].lower()
-                    if ext in ['.txt', '.log', '.ini', '.cfg']:
-                        icon = "📄"
-                    elif ext in ['.exe', '.dll', '.sys']:
-                        icon = "⚙️"
-                    elif ext in ['.jpg', '.png', '.gif', '.bmp']:
-                        icon = "🖼️"
-                    elif ext in ['.mp3', '.wav', '.mp4', '.avi']:
-                        icon = "🎵"
-                    else:
-                        icon = "📄"
-                    
-                    self.file_tree.insert(parent_node, 'end', text=f"{icon} {item_name}", 
-                                         values=[item_path])
-            
-            # If there are more items, add indicator
-            if len(items) > 100:
-                self.file_tree.insert(parent_node, 'end', text="... (more items)", values=[""])
-                
+            if items is None:
+                items = self._scan_directory(path)
         except PermissionError:
-            self.file_tree.insert(parent_node, 'end', text="❌ Permission Denied", values=[""])
+            return [("❌ Permission Denied", "", False)]
         except Exception as e:
-            self.file_tree.insert(parent_node, 'end', text=f"❌ Error: {str(e)}", values=[""])
+            return [(f"❌ Error: {str(e)}", "", False)]
+        
+        rows = []
+        splitext = os.path.splitext
+        icon_for = _EXT_ICON.get
+        for item_name, item_path, is_dir in items:
+            icon = "📁" if is_dir else icon_for(splitext(item_name)[1].lower(), "📄")
+            rows.append((f"{icon} {item_name}", item_path, is_dir))
+        
+        return rows
 
     def _expand_file_tree(self):
-        """Expand all nodes in file tree."""
-        def expand_all(item):
-            self.file_tree.item(item, open=True)
-            for child in self.file_tree.get_children(item):
-                expand_all(child)
-        
-        for item in self.file_tree.get_children():
-            expand_all(item)
+        """Expand all directories already listed in the file tree."""
+        self.file_tree.expand_all()
 
     def _collapse_file_tree(self):
         """Collapse all nodes in file tree."""
-        def collapse_all(item):
-            self.file_tree.item(item, open=False)
-            for child in self.file_tree.get_children(item):
-                collapse_all(child)
-        
-        for item in self.file_tree.get_children():
-            collapse_all(item)
+        self.file_tree.collapse_all()
 
     def _on_file_tree_double_click(self, event):
         """Handle double-click on file tree item."""
@@ -1565,25 +1702,11 @@ class CompleteDFW(Tk):
         file_path = item['values'][0]
         
         if os.path.isdir(file_path):
-            # Expand/collapse directory
-            current_state = self.file_tree.item(selection[0], 'open')
-            self.file_tree.item(selection[0], open=not current_state)
-            
-            # Lazy load directory contents
-            if not current_state:  # If expanding
-                # Remove placeholder
-                children = self.file_tree.get_children(selection[0])
-                for child in children:
-                    child_item = self.file_tree.item(child)
-                    if child_item['text'] == "Loading...":
-                        self.file_tree.delete(child)
-                        break
-                
-                # Load actual contents
-                self._load_directory_tree(file_path, selection[0], max_depth=1, current_depth=0)
-        else:
-            # Handle file double-click
-            self._open_file_in_hex_viewer(file_path)
+            self.file_tree.toggle(selection[0])
+            return
+        
+        # Handle file double-click
+        self._open_file_in_hex_viewer(file_path)
 
     def _open_file_in_hex_viewer(self, file_path):
         """Open file in hex viewer."""
@@ -1627,15 +1750,7 @@ class CompleteDFW(Tk):
                     with open(file_path, 'rb') as f:
                         data = f.read(min(file_size, 1024*1024))  # Read max 1MB
                     
-                    # Format as hex
-                    hex_lines = []
-                    for i in range(0, len(data), 16):
-                        chunk = data[i:i+16]
-                        hex_part = ' '.join(f'{b:02x}' for b in chunk)
-                        ascii_part = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-                        hex_lines.append(f'{i:08x}  {hex_part:<48} |{ascii_part}|')
-                    
-                    hex_text.insert('1.0', '\n'.join(hex_lines))
+                    hex_text.insert('1.0', hexdump(data))
                     hex_text.config(state='disabled')
                     
                 except Exception as e:
@@ -1648,6 +1763,7 @@ class CompleteDFW(Tk):
 
     def _analyze_all_browsers(self):
         """Analyze all browsers."""
+        self._ensure_tab(self._create_browser_tab)
         if not self.current_mount_point:
             messagebox.showwarning("No Mount", "Please mount an image first")
             return
@@ -1659,50 +1775,68 @@ class CompleteDFW(Tk):
         def analyze():
             try:
                 bf = BrowserForensics(self.current_mount_point)
-                artifacts = bf.analyze_all_browsers()
-
-                # Clear trees
-                for item in self.history_tree.get_children():
-                    self.history_tree.delete(item)
-                for item in self.downloads_tree.get_children():
-                    self.downloads_tree.delete(item)
+                artifacts = bf.analyze_all_browsers(sort_by="timestamp")
 
-                # Populate results
+                # Format all rows first, then repopulate the trees in one go
+                history_rows = []
+                download_rows = []
                 for artifact in artifacts:
+                    if artifact.artifact_type not in ("history", "download"):
+                        continue
+
+                    ts_dt = artifact.ts_dt
+                    when = ts_dt.strftime("%Y-%m-%d %H:%M") if ts_dt else ""
+
                     if artifact.artifact_type == "history":
-                        self.history_tree.insert('', 'end', values=(
+                        history_rows.append((
                             artifact.url[:50] if artifact.url else "",
                             artifact.title[:50] if artifact.title else "",
-                            artifact.timestamp.strftime("%Y-%m-%d %H:%M") if artifact.timestamp else "",
+                            when,
                             artifact.source_browser
                         ))
-                    elif artifact.artifact_type == "download":
-                        self.downloads_tree.insert('', 'end', values=(
+                    else:
+                        download_rows.append((
                             artifact.title or "",
                             artifact.url[:50] if artifact.url else "",
-                            artifact.timestamp.strftime("%Y-%m-%d %H:%M") if artifact.timestamp else "",
+                            when,
                             artifact.source_browser
                         ))
 
-                self.set_status(f"Found {len(artifacts)} browser artifacts")
-
-                # Add note
-                self.notes_widget.add_finding(
-                    "Browser Analysis",
-                    f"Found {len(artifacts)} browser artifacts",
-                    self.current_mount_point
-                )
+                # Parsing ran on the extraction pools; hand the finished rows
+                # to the Tk thread in one go
+                self.after(0, show, history_rows, download_rows, len(artifacts))
 
             except Exception as e:
-                messagebox.showerror("Error", str(e))
-            finally:
-                self.progress.stop()
-                self.progress['mode'] = 'determinate'
+                self.after(0, failed, str(e))
+
+        def show(history_rows, download_rows, count):
+            self._fill_tree(self.history_tree, history_rows)
+            self._fill_tree(self.downloads_tree, download_rows)
+            self._stop_progress()
+
+            self.set_status(f"Found {count} browser artifacts")
+
+            # Add note
+            self.notes_widget.add_finding(
+                "Browser Analysis",
+                f"Found {count} browser artifacts",
+                self.current_mount_point
+            )
+
+        def failed(message):
+            self._stop_progress()
+            messagebox.showerror("Error", message)
 
         threading.Thread(target=analyze, daemon=True).start()
 
+    def _stop_progress(self) -> None:
+        """Return the progress bar to its idle, determinate state."""
+        self.progress.stop()
+        self.progress['mode'] = 'determinate'
+
     def _analyze_registry(self):
         """Analyze Windows registry."""
+        self._ensure_tab(self._create_registry_tab)
         if not self.current_mount_point:
             messagebox.showwarning("No Mount", "Please mount a Windows image first")
             return
@@ -1715,31 +1849,36 @@ class CompleteDFW(Tk):
             try:
                 ra = RegistryAnalyzer(self.current_mount_point)
                 artifacts = ra.analyze_all()
-
-                # Display results
                 report = ra.export_report('text')
-                self.registry_text.delete('1.0', END)
-                self.registry_text.insert('1.0', report)
 
-                self.set_status(f"Found {len(artifacts)} registry artifacts")
-
-                # Add note
-                self.notes_widget.add_finding(
-                    "Registry Analysis",
-                    f"Found {len(artifacts)} registry artifacts",
-                    self.current_mount_point
-                )
+                self.after(0, show, report, len(artifacts))
 
             except Exception as e:
-                messagebox.showerror("Error", str(e))
-            finally:
-                self.progress.stop()
-                self.progress['mode'] = 'determinate'
+                self.after(0, failed, str(e))
+
+        def show(report, count):
+            self.registry_text.delete('1.0', END)
+            self.registry_text.insert('1.0', report)
+            self._stop_progress()
+
+            self.set_status(f"Found {count} registry artifacts")
+
+            # Add note
+            self.notes_widget.add_finding(
+                "Registry Analysis",
+                f"Found {count} registry artifacts",
+                self.current_mount_point
+            )
+
+        def failed(message):
+            self._stop_progress()
+            messagebox.showerror("Error", message)
 
         threading.Thread(target=analyze, daemon=True).start()
 
     def _run_regripper(self):
         """Run RegRipper on registry hives."""
+        self._ensure_tab(self._create_registry_tab)
         if not self.current_mount_point:
             messagebox.showwarning("No Mount", "Please mount a Windows image first")
             return
@@ -1763,6 +1902,7 @@ class CompleteDFW(Tk):
 
     def _generate_plaso_timeline(self):
         """Generate timeline using Plaso."""
+        self._ensure_tab(self._create_timeline_tab)
         if not self.current_mount_point:
             messagebox.showwarning("No Mount", "Please mount an image first")
             return
@@ -1815,6 +1955,32 @@ class CompleteDFW(Tk):
 
         threading.Thread(target=generate, daemon=True).start()
 
+    @staticmethod
+    def _iter_search_files(directory: str):
+        """Yield (path, size) for every file under directory.
+
+        Sizes come from the scandir entries, so files are filtered
+        without opening them. Symlinks are not followed, so a link in the
+        evidence cannot lead the search into the examiner's filesystem.
+        """
+        stack = [directory]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry.path, entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+            stack.extend(reversed(subdirs))
+
     def _run_search(self):
         """Run keyword search."""
         directory = self.search_dir.get()
@@ -1831,14 +1997,12 @@ class CompleteDFW(Tk):
         self.set_status("Searching...")
 
         # Clear results
-        for item in self.search_tree.get_children():
-            self.search_tree.delete(item)
+        self._fill_tree(self.search_tree, [])
 
         def search():
             try:
                 # Split keywords by comma, semicolon, or space
-                import re
-                keyword_list = [k.strip() for k in re.split(r'[,;\s]+', keywords_text) if k.strip()]
+                keyword_list = [k.strip() for k in _KEYWORD_SEPARATOR_RE.split(keywords_text) if k.strip()]
                 
                 if not keyword_list:
                     messagebox.showwarning("No Keywords", "Please enter valid keywords")
@@ -1846,67 +2010,42 @@ class CompleteDFW(Tk):
 
                 self.set_status(f"Searching for {len(keyword_list)} keywords in {directory}...")
                 
-                # Simple file search implementation
+                # The walk feeds a process pool; each worker skips binary
+                # files, then memory-maps the rest and scans them in one
+                # pass over all keywords
+                paths = (
+                    file_path for file_path, size in self._iter_search_files(directory)
+                    if size <= 10 * 1024 * 1024  # Skip files > 10MB
+                )
                 results = []
+                rows = []
                 search_count = 0
+                shown = 0
                 
-                for root, dirs, files in os.walk(directory):
-                    for file in files:
+                file_results = keywords.search_files(paths, keyword_list, limit=1001, text_only=True)
+                try:
+                    for found in file_results:
+                        for res in found[:1001 - search_count]:
+                            relative_path = os.path.relpath(res['file'], directory)
+                            rows.append((
+                                relative_path if len(relative_path) < 50 else "..." + relative_path[-47:],
+                                res['line'],
+                                res['context'][:100] + ("..." if len(res['context']) > 100 else "")
+                            ))
+                            results.append(res)
+                        search_count = len(results)
                         if search_count > 1000:  # Limit search results
                             break
-                            
-                        file_path = os.path.join(root, file)
                         
-                        # Skip binary files and large files
-                        try:
-                            if os.path.getsize(file_path) > 10 * 1024 * 1024:  # Skip files > 10MB
-                                continue
-                                
-                            # Try to read as text
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                content = f.read()
-                                
-                            # Search for keywords
-                            for keyword in keyword_list:
-                                if keyword.lower() in content.lower():
-                                    # Find context around keyword
-                                    lines = content.split('\n')
-                                    for line_num, line in enumerate(lines, 1):
-                                        if keyword.lower() in line.lower():
-                                            # Get context (line with some surrounding text)
-                                            context_start = max(0, line.find(keyword.lower()) - 20)
-                                            context_end = min(len(line), line.find(keyword.lower()) + len(keyword) + 20)
-                                            context = line[context_start:context_end]
-                                            
-                                            results.append({
-                                                'file': file_path,
-                                                'line': line_num,
-                                                'context': context,
-                                                'keyword': keyword
-                                            })
-                                            search_count += 1
-                                            
-                                            if search_count > 1000:
-                                                break
-                                    
-                                    if search_count > 1000:
-                                        break
-                                        
-                        except (UnicodeDecodeError, PermissionError, OSError):
-                            # Skip files that can't be read
-                            continue
-                    
-                    if search_count > 1000:
-                        break
+                        # Show matches as they arrive, in batches
+                        if search_count - shown >= 50:
+                            shown = search_count
+                            self.after(0, self._fill_tree, self.search_tree, list(rows))
+                finally:
+                    file_results.close()
 
                 # Display results
-                for res in results:
-                    relative_path = os.path.relpath(res['file'], directory)
-                    self.search_tree.insert('', 'end', values=(
-                        relative_path if len(relative_path) < 50 else "..." + relative_path[-47:],
-                        res['line'],
-                        res['context'][:100] + ("..." if len(res['context']) > 100 else "")
-                    ))
+                self.after(0, self._fill_tree, self.search_tree, rows)
 
                 result_msg = f"Found {len(results)} matches"
                 if search_count > 1000:
@@ -1972,6 +2111,10 @@ class CompleteDFW(Tk):
 
     def _generate_report(self):
         """Generate final report."""
+        # The report reads every tab's results; unbuilt tabs are simply empty
+        for builder in list(self._tab_builders.values()):
+            self._ensure_tab(builder)
+
         report_type = self.report_type.get()
         report_format = self.report_format.get()
 
@@ -2002,14 +2145,12 @@ class CompleteDFW(Tk):
         report_content += self.registry_text.get('1.0', END) + "\n\n"
 
         report_content += f"## Timeline Analysis\n"
-        for item in self.timeline_tree.get_children():
-            values = self.timeline_tree.item(item)['values']
+        for values in self.timeline_tree.iter_rows():
             report_content += f"- Timestamp: {values[0]}, Source: {values[1]}, Event: {values[2]}, Details: {values[3]}\n"
         report_content += "\n\n"
 
         report_content += f"## Keyword Search\n"
-        for item in self.search_tree.get_children():
-            values = self.search_tree.item(item)['values']
+        for values in self.search_tree.iter_rows():
             report_content += f"- File: {values[0]}, Context: {values[2]}\n"
         report_content += "\n\n"
 
@@ -2096,7 +2237,7 @@ class CompleteDFW(Tk):
 
     def _export_timeline(self):
         """Export timeline results."""
-        if not self.timeline_tree.get_children():
+        if not self.timeline_tree.row_count():
             messagebox.showwarning("No Data", "No timeline data to export")
             return
 
@@ -2112,22 +2253,18 @@ class CompleteDFW(Tk):
             with open(export_path, 'w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(['Timestamp', 'Source', 'Event', 'Details'])
-                for item in self.timeline_tree.get_children():
-                    writer.writerow(self.timeline_tree.item(item)['values'])
+                writer.writerows(self.timeline_tree.iter_rows())
             messagebox.showinfo("Export", "Timeline exported successfully")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {e}")
 
     def _load_timeline_csv(self, csv_file):
         """Load CSV timeline into treeview."""
-        for item in self.timeline_tree.get_children():
-            self.timeline_tree.delete(item)
-
         with open(csv_file, 'r') as f:
             reader = csv.reader(f)
             next(reader) # Skip header
-            for row in reader:
-                self.timeline_tree.insert('', 'end', values=row)
+            # The rows stream straight into the timeline's row store
+            self._fill_tree(self.timeline_tree, reader)
 
     def _run_full_analysis(self):
         """Run full analysis."""
@@ -2146,9 +2283,98 @@ class CompleteDFW(Tk):
 
         self.set_status("Full analysis complete")
 
+    def _load_yara_rules(self, rules_path: str):
+        """Return compiled YARA rules, compiling a rule file at most once.
+
+        Compiled rules are kept in memory for the session and saved under
+        ~/.dfw/yara_cache keyed by the SHA-256 of the rule source, so later
+        scans (and later runs) load them instead of recompiling.
+
+        Args:
+            rules_path: Path to a YARA rule source file
+
+        Returns:
+            Compiled yara.Rules
+        """
+        with open(rules_path, 'rb') as f:
+            key = hashlib.sha256(f.read()).hexdigest()
+
+        rules = self._yara_rules_cache.get(key)
+        if rules is not None:
+            return rules
+
+        cache_path = YARA_CACHE_DIR / f"{key}.yarac"
+        try:
+            rules = yara.load(str(cache_path))
+        except yara.Error:
+            rules = yara.compile(filepath=rules_path)
+            try:
+                YARA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                rules.save(str(cache_path))
+            except (OSError, yara.Error):
+                pass  # Caching is best effort
+
+        self._yara_rules_cache[key] = rules
+        return rules
+
     def _run_yara_scan(self):
-        """Run YARA scan."""
-        messagebox.showinfo("YARA Scan", "YARA scan functionality to be implemented.")
+        """Run YARA scan over the mounted evidence."""
+        if yara is None:
+            messagebox.showerror("YARA Scan", "YARA scanning requires the yara-python package")
+            return
+
+        if not self.current_mount_point:
+            messagebox.showwarning("No Mount", "Please mount an image first")
+            return
+
+        rules_path = filedialog.askopenfilename(
+            title="Select YARA Rules",
+            initialdir=os.path.expanduser("~/.dfw/yara_rules"),
+            filetypes=[("YARA rules", "*.yar *.yara"), ("All files", "*.*")]
+        )
+        if not rules_path:
+            return
+
+        scan_root = self.current_mount_point
+        self.set_status("Running YARA scan...")
+
+        def scan():
+            try:
+                rules = self._load_yara_rules(rules_path)
+
+                # libyara maps each file itself; no per-file process. Only
+                # regular files are scanned: libyara would follow symlinks
+                # out of the evidence and block opening FIFOs and devices
+                lines = []
+                scanned = 0
+                for file_path, _ in self._iter_search_files(scan_root):
+                    try:
+                        matches = rules.match(file_path, timeout=60)
+                    except yara.Error:
+                        continue
+                    scanned += 1
+                    for match in matches:
+                        lines.append(f"{match.rule}: {os.path.relpath(file_path, scan_root)}\n")
+
+                report = f"Scanned {scanned} files with {os.path.basename(rules_path)}\n"
+                report += f"{len(lines)} matches\n\n" + "".join(lines)
+
+                def show():
+                    window = Toplevel(self)
+                    window.title("YARA Scan Results")
+                    window.geometry("800x600")
+                    text = Text(window, wrap=NONE)
+                    text.pack(fill=BOTH, expand=True)
+                    text.insert(END, report)
+                    self.set_status(f"YARA scan complete: {len(lines)} matches")
+
+                self.after(0, show)
+
+            except Exception as e:
+                error_msg = f"YARA scan failed: {str(e)}"
+                self.after(0, lambda: (self.set_status(error_msg), messagebox.showerror("YARA Scan", error_msg)))
+
+        threading.Thread(target=scan, daemon=True).start()
 
     def _run_bulk_extractor(self):
         """Run Bulk Extractor."""
@@ -2201,13 +2427,13 @@ class CompleteDFW(Tk):
         algo_frame.pack(fill=X, padx=10, pady=5)
         
         Label(algo_frame, text="Algorithms:").pack(side=LEFT)
-        md5_var = BooleanVar(value=True)
-        sha1_var = BooleanVar(value=True)
         sha256_var = BooleanVar(value=True)
+        md5_var = BooleanVar(value=False)
+        sha1_var = BooleanVar(value=False)
         
-        Checkbutton(algo_frame, text="MD5", variable=md5_var).pack(side=LEFT)
-        Checkbutton(algo_frame, text="SHA1", variable=sha1_var).pack(side=LEFT)
         Checkbutton(algo_frame, text="SHA256", variable=sha256_var).pack(side=LEFT)
+        Checkbutton(algo_frame, text="MD5 (legacy)", variable=md5_var).pack(side=LEFT)
+        Checkbutton(algo_frame, text="SHA1 (legacy)", variable=sha1_var).pack(side=LEFT)
         
         # Results
         result_text = Text(hash_window, height=15)
@@ -2222,29 +2448,25 @@ class CompleteDFW(Tk):
             result_text.delete("1.0", END)
             result_text.insert(END, f"Calculating hashes for: {file_path}\n\n")
             
+            selected = [
+                (algo, label) for algo, label, var in (
+                    ('md5', "MD5:   ", md5_var),
+                    ('sha1', "SHA1:  ", sha1_var),
+                    ('sha256', "SHA256:", sha256_var),
+                ) if var.get()
+            ]
+            
             try:
-                if md5_var.get():
-                    md5_hash = hashlib.md5()
-                    with open(file_path, 'rb') as f:
-                        for chunk in iter(lambda: f.read(4096), b""):
-                            md5_hash.update(chunk)
-                    result_text.insert(END, f"MD5:    {md5_hash.hexdigest()}\n")
-                
-                if sha1_var.get():
-                    sha1_hash = hashlib.sha1()
-                    with open(file_path, 'rb') as f:
-                        for chunk in iter(lambda: f.read(4096), b""):
-                            sha1_hash.update(chunk)
-                    result_text.insert(END, f"SHA1:   {sha1_hash.hexdigest()}\n")
-                
-                if sha256_var.get():
-                    sha256_hash = hashlib.sha256()
-                    with open(file_path, 'rb') as f:
-                        for chunk in iter(lambda: f.read(4096), b""):
-                            sha256_hash.update(chunk)
-                    result_text.insert(END, f"SHA256: {sha256_hash.hexdigest()}\n")
+                # Read the file once and feed every selected hasher
+                hashes = self.case_manager.calculate_file_hashes(
+                    file_path, tuple(algo for algo, _ in selected)
+                )
+                if hashes is None:
+                    raise OSError(f"Could not read {file_path}")
                 
-                result_text.insert(END, f"\nFile size: {os.path.getsize(file_path)} bytes\n")
+                lines = [f"{label} {hashes[algo]}\n" for algo, label in selected]
+                lines.append(f"\nFile size: {os.path.getsize(file_path)} bytes\n")
+                result_text.insert(END, "".join(lines))
                 
             except Exception as e:
                 result_text.insert(END, f"Error: {str(e)}\n")
@@ -2338,12 +2560,14 @@ class CompleteDFW(Tk):
                 if len(current_string) >= min_len:
                     strings_found.append(current_string)
                 
-                result_text.insert(END, f"Found {len(strings_found)} strings:\n\n")
-                for i, string in enumerate(strings_found[:1000]):  # Limit to first 1000
-                    result_text.insert(END, f"{i+1:6d}: {string}\n")
+                # Build the listing first and insert it with a single call
+                lines = [f"Found {len(strings_found)} strings:\n\n"]
+                lines.extend(f"{i+1:6d}: {string}\n"
+                             for i, string in enumerate(strings_found[:1000]))  # Limit to first 1000
                 
                 if len(strings_found) > 1000:
-                    result_text.insert(END, f"\n... and {len(strings_found) - 1000} more strings")
+                    lines.append(f"\n... and {len(strings_found) - 1000} more strings")
+                result_text.insert(END, "".join(lines))
                 
             except Exception as e:
                 result_text.insert(END, f"Error: {str(e)}\n")
@@ -2425,27 +2649,8 @@ class CompleteDFW(Tk):
                         return
                     
                     # Format hex display
-                    for i in range(0, len(data), 16):
-                        # Offset
-                        offset = start_offset + i
-                        line = f"{offset:08X}  "
-                        
-                        # Hex bytes
-                        hex_part = ""
-                        ascii_part = ""
-                        
-                        for j in range(16):
-                            if i + j < len(data):
-                                byte = data[i + j]
-                                hex_part += f"{byte:02X} "
-                                ascii_part += chr(byte) if 32 <= byte <= 126 else "."
-                            else:
-                                hex_part += "   "
-                                ascii_part += " "
-                        
-                        line += hex_part + " |" + ascii_part + "|\n"
-                        hex_text.insert(END, line)
-                        
+                    hex_text.insert(END, hexdump(data, start_offset, uppercase=True) + "\n")
+                    
             except Exception as e:
                 hex_text.insert(END, f"Error reading file: {str(e)}")
         
@@ -2457,8 +2662,52 @@ class CompleteDFW(Tk):
         status_label.pack(fill=X)
 
     def _run_file_carver(self):
-        """Run file carver."""
-        messagebox.showinfo("File Carver", "File carver functionality to be implemented.")
+        """Carve known file types out of a disk image."""
+        image = self.image_path.get() or filedialog.askopenfilename(
+            title="Select Disk Image",
+            filetypes=[("Disk Images", "*.dd *.raw *.img *.bin"), ("All Files", "*.*")]
+        )
+        if not image:
+            return
+        if not os.path.isfile(image):
+            messagebox.showerror("Error", f"Image not found: {image}")
+            return
+
+        output_dir = os.path.join(self.case_dir, "exports", "carved")
+        self.set_status("Carving files...")
+
+        def run():
+            try:
+                files = carver.carve_image(image, output_dir)
+
+                counts: Dict[str, int] = {}
+                for carved in files:
+                    counts[carved.extension] = counts.get(carved.extension, 0) + 1
+
+                report = f"Carved {len(files)} files from {os.path.basename(image)}\n"
+                report += f"Output: {output_dir}\n\n"
+                report += "".join(f"{ext}: {count}\n" for ext, count in sorted(counts.items()))
+                report += "\n" + "".join(
+                    f"{carved.offset:>14,}  {format_bytes(carved.size):>10}  {os.path.basename(carved.path)}\n"
+                    for carved in files
+                )
+
+                def show():
+                    window = Toplevel(self)
+                    window.title("File Carver Results")
+                    window.geometry("800x600")
+                    text = Text(window, wrap=NONE)
+                    text.pack(fill=BOTH, expand=True)
+                    text.insert(END, report)
+                    self.set_status(f"File carving complete: {len(files)} files")
+
+                self.after(0, show)
+
+            except Exception as e:
+                error_msg = f"File carving failed: {str(e)}"
+                self.after(0, lambda: (self.set_status(error_msg), messagebox.showerror("File Carver", error_msg)))
+
+        threading.Thread(target=run, daemon=True).start()
 
     def _check_tools(self):
         """Check external tools."""
@@ -2661,12 +2910,11 @@ class CompleteDFW(Tk):
                     hash_text.insert(END, "Calculating hash...\n")
                     evidence_window.update()
                     
-                    sha256_hash = hashlib.sha256()
-                    with open(path, 'rb') as f:
-                        for chunk in iter(lambda: f.read(4096), b""):
-                            sha256_hash.update(chunk)
+                    hashes = self.case_manager.calculate_file_hashes(path, ('sha256',))
+                    if hashes is None:
+                        raise OSError(f"Could not read {path}")
                     
-                    evidence_data['hash'] = sha256_hash.hexdigest()
+                    evidence_data['hash'] = hashes['sha256']
                     hash_text.insert(END, f"SHA256: {evidence_data['hash']}\n")
                 except Exception as e:
                     hash_text.insert(END, f"Hash calculation failed: {str(e)}\n")
@@ -2780,52 +3028,50 @@ class CompleteDFW(Tk):
         results_text.pack(fill=BOTH, expand=True, padx=10, pady=5)
         
         def run_analysis():
-            results_text.delete("1.0", END)
-            results_text.insert(END, f"Analyzing: {evidence_data['path']}\n")
-            results_text.insert(END, "=" * 50 + "\n\n")
+            # Collect the report and insert it once at the end
+            path = evidence_data['path']
+            lines = [f"Analyzing: {path}\n", "=" * 50 + "\n\n"]
             
             try:
                 if file_analysis.get():
-                    results_text.insert(END, "File Type Analysis:\n")
-                    if os.path.isfile(evidence_data['path']):
+                    lines.append("File Type Analysis:\n")
+                    if os.path.isfile(path):
                         # Basic file info
-                        stat = os.stat(evidence_data['path'])
-                        results_text.insert(END, f"Size: {stat.st_size} bytes\n")
-                        results_text.insert(END, f"Modified: {datetime.datetime.fromtimestamp(stat.st_mtime)}\n")
-                        results_text.insert(END, f"Created: {datetime.datetime.fromtimestamp(stat.st_ctime)}\n")
-                    results_text.insert(END, "\n")
+                        stat = os.stat(path)
+                        lines.append(f"Size: {stat.st_size} bytes\n")
+                        lines.append(f"Modified: {datetime.datetime.fromtimestamp(stat.st_mtime)}\n")
+                        lines.append(f"Created: {datetime.datetime.fromtimestamp(stat.st_ctime)}\n")
+                    lines.append("\n")
                 
-                if hash_analysis.get() and os.path.isfile(evidence_data['path']):
-                    results_text.insert(END, "Hash Analysis:\n")
+                if hash_analysis.get() and os.path.isfile(path):
+                    lines.append("Hash Analysis:\n")
                     
-                    # Calculate multiple hashes
-                    md5_hash = hashlib.md5()
-                    sha1_hash = hashlib.sha1()
-                    sha256_hash = hashlib.sha256()
+                    # Calculate multiple hashes in one pass; always reread
+                    # the file, since this verifies the evidence
+                    hashes = self.case_manager.calculate_file_hashes(path)
+                    if hashes is None:
+                        raise OSError(f"Could not read {path}")
                     
-                    with open(evidence_data['path'], 'rb') as f:
-                        for chunk in iter(lambda: f.read(4096), b""):
-                            md5_hash.update(chunk)
-                            sha1_hash.update(chunk)
-                            sha256_hash.update(chunk)
-                    
-                    results_text.insert(END, f"MD5:    {md5_hash.hexdigest()}\n")
-                    results_text.insert(END, f"SHA1:   {sha1_hash.hexdigest()}\n")
-                    results_text.insert(END, f"SHA256: {sha256_hash.hexdigest()}\n\n")
+                    lines.append(f"MD5:    {hashes['md5']}\n")
+                    lines.append(f"SHA1:   {hashes['sha1']}\n")
+                    lines.append(f"SHA256: {hashes['sha256']}\n\n")
                 
                 if metadata_analysis.get():
-                    results_text.insert(END, "Metadata Analysis:\n")
-                    results_text.insert(END, f"Full path: {os.path.abspath(evidence_data['path'])}\n")
-                    results_text.insert(END, f"Evidence type: {evidence_data['type']}\n")
-                    results_text.insert(END, f"Added to case: {evidence_data['added_date']}\n")
+                    lines.append("Metadata Analysis:\n")
+                    lines.append(f"Full path: {os.path.abspath(path)}\n")
+                    lines.append(f"Evidence type: {evidence_data['type']}\n")
+                    lines.append(f"Added to case: {evidence_data['added_date']}\n")
                     if evidence_data.get('hash'):
-                        results_text.insert(END, f"Stored hash: {evidence_data['hash']}\n")
-                    results_text.insert(END, "\n")
+                        lines.append(f"Stored hash: {evidence_data['hash']}\n")
+                    lines.append("\n")
                 
-                results_text.insert(END, "Analysis complete.\n")
+                lines.append("Analysis complete.\n")
                 
             except Exception as e:
-                results_text.insert(END, f"Analysis error: {str(e)}\n")
+                lines.append(f"Analysis error: {str(e)}\n")
+            
+            results_text.delete("1.0", END)
+            results_text.insert(END, "".join(lines))
         
         Button(analysis_window, text="Run Analysis", command=run_analysis).pack(pady=10)
         
@@ -2833,8 +3079,44 @@ class CompleteDFW(Tk):
         run_analysis()
 
     def _hash_evidence(self):
-        """Calculate hash of selected evidence item."""
-        messagebox.showinfo("Hash Evidence", "Hash evidence functionality to be implemented.")
+        """Calculate hashes of the selected evidence item.
+
+        Results are cached by the case manager, so hashing an unchanged
+        item again returns immediately.
+        """
+        selection = self.evidence_tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Please select an evidence item")
+            return
+        
+        item = self.evidence_tree.item(selection[0])
+        path = item['values'][-1] if item['values'] else None
+        if not path or not os.path.isfile(path):
+            messagebox.showwarning("Hash Evidence", "Only evidence files can be hashed")
+            return
+        
+        self.set_status(f"Hashing {os.path.basename(path)}...")
+        
+        def run():
+            hashes = self.case_manager.cached_file_hashes(path)
+            
+            def show():
+                if hashes is None:
+                    self.set_status("Hashing failed")
+                    messagebox.showerror("Hash Evidence", f"Could not read {path}")
+                    return
+                self.set_status(f"Hashed {os.path.basename(path)}")
+                messagebox.showinfo(
+                    "Hash Evidence",
+                    f"{path}\n\n"
+                    f"MD5:    {hashes['md5']}\n"
+                    f"SHA1:   {hashes['sha1']}\n"
+                    f"SHA256: {hashes['sha256']}"
+                )
+            
+            self.after(0, show)
+        
+        threading.Thread(target=run, daemon=True).start()
 
     def _remove_evidence(self):
         """Remove selected evidence item."""
@@ -2848,8 +3130,56 @@ class CompleteDFW(Tk):
             self.evidence_menu.grab_release()
 
     def _import_evidence(self):
-        """Import evidence."""
-        messagebox.showinfo("Import Evidence", "Import evidence functionality to be implemented.")
+        """Copy an evidence file into the case and add it to the evidence list."""
+        source = filedialog.askopenfilename(
+            title="Select Evidence to Import",
+            filetypes=[("All Files", "*.*")]
+        )
+        if not source:
+            return
+
+        case_path = self.case_manager.current_case_path
+        evidence_dir = str(case_path / "evidence") if case_path else os.path.join(self.case_dir, "evidence")
+        dest = os.path.join(evidence_dir, os.path.basename(source))
+        if os.path.exists(dest):
+            messagebox.showerror("Import Evidence", f"Evidence already exists in case:\n{dest}")
+            return
+
+        self.set_status(f"Importing {os.path.basename(source)}...")
+
+        def run():
+            try:
+                os.makedirs(evidence_dir, exist_ok=True)
+                # Kernel-side copy; multi-GB images never pass through Python
+                copy_file(source, dest)
+
+                hashes = self.case_manager.calculate_file_hashes(dest)
+                if hashes is None:
+                    raise OSError(f"Could not read {dest}")
+
+                evidence = EvidenceItem(
+                    name=os.path.basename(source),
+                    path=dest,
+                    item_type='file',
+                    hash_md5=hashes['md5'],
+                    hash_sha1=hashes['sha1'],
+                    hash_sha256=hashes['sha256'],
+                    size_bytes=os.path.getsize(dest),
+                    description=f"Imported from {source}"
+                )
+
+                def done():
+                    self.case_manager.add_evidence_item(evidence)
+                    self._refresh_evidence_tree()
+                    self.set_status(f"Imported {evidence.name} (SHA256 {hashes['sha256'][:16]}...)")
+
+                self.after(0, done)
+
+            except Exception as e:
+                error_msg = f"Import failed: {str(e)}"
+                self.after(0, lambda: (self.set_status(error_msg), messagebox.showerror("Import Evidence", error_msg)))
+
+        threading.Thread(target=run, daemon=True).start()
 
     def _export_report(self):
         """Export report."""
@@ -2921,15 +3251,15 @@ class CompleteDFW(Tk):
         result = messagebox.askyesnocancel(
             "Hash Calculation", 
             "Hash calculation may take a long time for large images.\n\n"
-            "Yes = Calculate MD5 only (faster)\n"
-            "No = Calculate MD5 + SHA256 (slower)\n"
+            "Yes = Calculate SHA256 only (recommended)\n"
+            "No = Calculate SHA256 + legacy MD5\n"
             "Cancel = Skip hash calculation"
         )
         
         if result is None:  # Cancel
             return
         
-        calculate_sha256 = not result  # No = True (calculate both), Yes = False (MD5 only)
+        calculate_md5 = not result  # No = True (calculate both), Yes = False (SHA256 only)
 
         self.set_status("Calculating hash... (this may take several minutes)")
         self.hash_label.config(text="Calculating hash... Please wait")
@@ -2938,32 +3268,31 @@ class CompleteDFW(Tk):
             try:
                 file_size = os.path.getsize(image)
                 processed = 0
-                chunk_size = 1024 * 1024  # 1MB chunks for better performance
+                chunk_size = 4 * 1024 * 1024  # 4MB slices of the mapped image
                 
-                md5 = hashlib.md5()
-                sha256 = hashlib.sha256() if calculate_sha256 else None
-
-                with open(image, 'rb') as f:
-                    while True:
-                        chunk = f.read(chunk_size)
-                        if not chunk:
-                            break
-                        
+                # SHA-256 runs on the CPU's SHA extensions where OpenSSL has
+                # them, so it is usually faster than MD5 as well as stronger
+                sha256 = hashlib.sha256()
+                md5 = hashlib.md5() if calculate_md5 else None
+
+                # The image is memory-mapped with sequential read-ahead
+                # advice, so hashing works on page-cache pages directly
+                for chunk in iter_image_chunks(image, chunk_size):
+                    sha256.update(chunk)
+                    if md5:
                         md5.update(chunk)
-                        if sha256:
-                            sha256.update(chunk)
-                        
-                        processed += len(chunk)
-                        
-                        # Update progress every 100MB
-                        if processed % (100 * 1024 * 1024) == 0:
-                            progress = (processed / file_size) * 100
-                            self.set_status(f"Calculating hash... {progress:.1f}% complete")
+                    
+                    processed += len(chunk)
+                    
+                    # Update progress every 100MB
+                    if processed % (100 * 1024 * 1024) == 0:
+                        progress = (processed / file_size) * 100
+                        self.set_status(f"Calculating hash... {progress:.1f}% complete")
 
                 # Display results
-                hash_text = f"MD5: {md5.hexdigest()}"
-                if sha256:
-                    hash_text += f"\nSHA256: {sha256.hexdigest()}"
+                hash_text = f"SHA256: {sha256.hexdigest()}"
+                if md5:
+                    hash_text += f"\nMD5: {md5.hexdigest()}"
                 
                 self.hash_label.config(text=hash_text)
                 self.set_status("Hash calculation complete")
@@ -2979,6 +3308,68 @@ class CompleteDFW(Tk):
 
         threading.Thread(target=calc, daemon=True).start()
 
+    def _calc_image_tree_hash(self):
+        """Calculate a parallel SHA-256 tree hash of the disk image.
+
+        The image is hashed in 256MB slices on all cores and the slice
+        digests are hashed again into a root. This is much faster than a
+        plain hash on fast storage and pinpoints which region changed, but
+        the root is not comparable with a plain SHA-256 from other tools.
+        """
+        image = self.image_path.get()
+        if not image:
+            messagebox.showwarning("No Image", "Please select a disk image first")
+            return
+
+        if not os.path.exists(image):
+            messagebox.showerror("Error", "Image file not found")
+            return
+
+        self.set_status("Calculating tree hash...")
+        self.hash_label.config(text="Calculating tree hash... Please wait")
+
+        def calc():
+            try:
+                root, slices = tree_hash(image)
+
+                hash_text = f"SHA256 tree root: {root}"
+
+                # Per-slice digests, for locating tampering within the image;
+                # a large image has thousands, so they get their own window
+                report = f"{image}\n{hash_text}\n\nSlices (256MB):\n" + "".join(
+                    f"{format_bytes(offset):>12}  {digest}\n" for offset, digest in slices
+                )
+
+                def show():
+                    self.hash_label.config(text=hash_text)
+                    self.set_status("Tree hash calculation complete")
+
+                    window = Toplevel(self)
+                    window.title("Tree Hash Slices")
+                    window.geometry("800x600")
+                    scrollbar = ttk.Scrollbar(window, orient=VERTICAL)
+                    scrollbar.pack(side=RIGHT, fill=Y)
+                    text = Text(window, wrap=NONE, yscrollcommand=scrollbar.set)
+                    text.pack(fill=BOTH, expand=True)
+                    scrollbar.config(command=text.yview)
+                    text.insert(END, report)
+
+                    messagebox.showinfo("Tree Hash Results", f"{hash_text}\n\n{len(slices)} slice digests are listed in the Tree Hash Slices window.", parent=window)
+
+                self.after(0, show)
+
+            except Exception as e:
+                error_msg = f"Tree hash calculation failed: {str(e)}"
+
+                def failed():
+                    self.hash_label.config(text="Hash calculation failed")
+                    self.set_status(error_msg)
+                    messagebox.showerror("Error", error_msg)
+
+                self.after(0, failed)
+
+        threading.Thread(target=calc, daemon=True).start()
+
     def _run_quick_triage(self):
         """Run quick triage analysis."""
         if not self.current_mount_point:
@@ -3073,8 +3464,7 @@ Features:
             return
         
         # Sanitize directory name
-        import re
-        dir_name = re.sub(r'[<>:"/\\|?*]', '_', dir_name)
+        dir_name = _UNSAFE_DIR_CHARS_RE.sub('_', dir_name)
         
         new_path = os.path.join(parent_dir, dir_name)
         
@@ -3113,6 +3503,7 @@ Features:
             return
         
         self.set_status("Extracting files from image...")
+        self.flush_status()
         try:
             # Use external tools for extraction
             result = self.tool_manager.run_tool("tsk_recover", ["-e", image_path, extract_dir])
@@ -3135,6 +3526,7 @@ Features:
         try:
             result = mount.unmount_image(self.current_mount_point)
             if result:
+                OSDetector.clear_cache()
                 messagebox.showinfo("Success", "Image unmounted successfully")
                 self.current_mount_point = None
                 self.set_status("Image unmounted")
@@ -3144,11 +3536,27 @@ Features:
             messagebox.showerror("Error", f"Unmount error: {str(e)}")
 
     def set_status(self, message):
-        """Set status bar message."""
-        if hasattr(self, 'status_label'):
-            self.status_label.config(text=message)
+        """Set status bar message.
+
+        The label is updated once the event loop is next idle, so a burst
+        of messages from a loop costs one repaint. Call flush_status() to
+        show the message before a blocking operation.
+        """
+        self._status_message = message
+        if not self._status_pending and hasattr(self, 'status_label'):
+            self._status_pending = True
+            self.after_idle(self._paint_status)
         print(f"Status: {message}")  # Fallback for debugging
 
+    def _paint_status(self) -> None:
+        """Show the latest status message."""
+        self._status_pending = False
+        self.status_label.config(text=self._status_message)
+
+    def flush_status(self) -> None:
+        """Paint the status bar now rather than when the event loop is idle."""
+        self.update_idletasks()
+
 
 def main():
     """Main entry point."""
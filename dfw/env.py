@@ -7,17 +7,26 @@ environment checks here we avoid duplicating logic in the GUI layer
 and can easily extend the list of tools in the future.
 
 Functions:
-    check_environment() -> dict
+    check_environment(use_cache=True) -> dict
         Returns a dictionary describing the current OS and the
         presence of key forensic tools on the PATH.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import platform
 import shutil
 import subprocess
-from typing import Dict, Any
+import sys
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Tool availability from the last check, reused while the search paths
+# that determine it are unchanged
+TOOLS_CACHE_FILE = Path.home() / ".dfw" / "env_tools.json"
 
 
 def _command_exists(cmd: str) -> bool:
@@ -55,7 +64,49 @@ def _detect_wsl() -> bool:
         return False
 
 
-def check_environment() -> Dict[str, Any]:
+def _search_path_signature() -> str:
+    """Fingerprint everything that decides whether a tool can be found.
+
+    Covers the executable search path and the Python import path, plus the
+    modification time of every directory on them, so installing or removing
+    a tool or module changes the signature.
+    """
+    dirs = os.environ.get("PATH", "").split(os.pathsep) + sys.path
+    mtimes = []
+    for directory in dirs:
+        try:
+            mtimes.append(os.stat(directory or ".").st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    probe = [sys.executable, dirs, mtimes]
+    return hashlib.sha256(json.dumps(probe).encode()).hexdigest()
+
+
+def _load_cached_tools(signature: str) -> Optional[Dict[str, bool]]:
+    """Return cached tool availability if it was recorded for this signature."""
+    try:
+        with open(TOOLS_CACHE_FILE, "r") as f:
+            data = json.load(f)
+        if data.get("signature") == signature:
+            return data["tools"]
+    except Exception:
+        pass
+    return None
+
+
+def _save_cached_tools(signature: str, tools: Dict[str, bool]) -> None:
+    """Persist tool availability for later runs; failures are ignored."""
+    try:
+        TOOLS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = TOOLS_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({"signature": signature, "tools": tools}, f)
+        os.replace(tmp_file, TOOLS_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def check_environment(use_cache: bool = True) -> Dict[str, Any]:
     """Gather and return environment information relevant to digital forensics.
 
     The returned dictionary includes the host OS type, version, whether
@@ -65,6 +116,12 @@ def check_environment() -> Dict[str, Any]:
     additional integrations are added to the workbench. Only tools
     commonly used in digital forensics are included by default.
 
+    Tool availability is cached in ``~/.dfw/env_tools.json`` and reused
+    as long as the search paths and their directories are unchanged.
+
+    Args:
+        use_cache: Reuse the cached tool availability when still valid.
+
     Returns:
         A dictionary with keys ``"os_type"``, ``"os_version"``,
         ``"is_wsl"`` and ``"tools"``. ``tools`` itself is a
@@ -94,6 +151,16 @@ def check_environment() -> Dict[str, Any]:
         "aleapp",      # Android artefact parser
         "pytsk3"       # Python binding for The Sleuth Kit (checked via import)
     ]
+    signature = _search_path_signature()
+    cached = _load_cached_tools(signature) if use_cache else None
+    if cached is not None and set(cached) == set(tool_names):
+        return {
+            "os_type": os_type,
+            "os_version": os_version,
+            "is_wsl": is_wsl,
+            "tools": cached,
+        }
+
     tools: Dict[str, bool] = {}
     # We check the availability of all tools except ``pytsk3`` with
     # shutil.which.  For pytsk3 the Python import mechanism is used
@@ -110,6 +177,7 @@ def check_environment() -> Dict[str, Any]:
                 tools[cmd] = False
         else:
             tools[cmd] = _command_exists(cmd)
+    _save_cached_tools(signature, tools)
     return {
         "os_type": os_type,
         "os_version": os_version,
@@ -14,9 +14,404 @@ illustrate the concept and can be extended as needed.
 
 from __future__ import annotations
 
+import bisect
+import mmap
+import multiprocessing
 import os
 import re
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None  # type: ignore
+
+try:
+    import hyperscan  # type: ignore
+except ImportError:
+    hyperscan = None  # type: ignore
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # type: ignore
+
+
+# Files queued per search worker: keeps workers busy while bounding the
+# results held and the work discarded when a search stops early
+SEARCH_QUEUE_DEPTH = 4
+
+# Bytes sniffed from the start of a file by text-only searches, and the
+# leading bytes of common binary formats (PE, ELF, ZIP, PNG) they skip
+SNIFF_SIZE = 4096
+BINARY_SIGNATURES = (b'MZ', b'\x7fELF', b'PK\x03\x04', b'\x89PNG')
+
+# Bytes handed to Hyperscan per stream call when scanning bytes-like input
+HYPERSCAN_CHUNK_SIZE = 1024 * 1024
+
+
+def _hyperscan_database(words: List[bytes]):
+    """Compile a caseless Hyperscan streaming database for literal words.
+
+    Every byte is written as a ``\\xHH`` escape so no keyword is read as
+    pattern syntax; pattern ids are the word indices.
+    """
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_STREAM)
+    database.compile(
+        expressions=[b''.join(b'\\x%02x' % byte for byte in word) for word in words],
+        ids=list(range(len(words))),
+        elements=len(words),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(words),
+    )
+    return database
+
+
+def _overlapping_pattern(words: Sequence[Union[str, bytes]]) -> Tuple["re.Pattern", List[List[int]]]:
+    """Compile a case-insensitive alternation reporting overlapping matches.
+
+    A lookahead alternation tries every position, so matches may overlap.
+    Only the longest word starting at a position is reported by the regex;
+    shorter words matching there are exactly its prefixes, which are
+    returned alongside the pattern.
+
+    Args:
+        words: Non-empty words, all str or all bytes. Bytes patterns fold
+            ASCII letters only.
+
+    Returns:
+        The compiled pattern (group ``k<i>`` matches ``words[i]``) and, for
+        each word, the indices of the other words that are its prefixes.
+    """
+    order = sorted(range(len(words)), key=lambda i: -len(words[i]))
+    if isinstance(words[0], bytes):
+        body = b'|'.join(b'(?P<k%d>%s)' % (i, re.escape(words[i])) for i in order)
+        pattern = re.compile(b'(?=' + body + b')', flags=re.IGNORECASE)
+    else:
+        body = '|'.join(f'(?P<k{i}>{re.escape(words[i])})' for i in order)
+        pattern = re.compile('(?=' + body + ')', flags=re.IGNORECASE)
+    folded = [w.lower() for w in words]
+    prefixes = [
+        [j for j, other in enumerate(folded) if j != i and len(other) < len(word) and word.startswith(other)]
+        for i, word in enumerate(folded)
+    ]
+    return pattern, prefixes
+
+
+class KeywordMatcher:
+    """Case-insensitive matcher for a set of keywords.
+
+    All keywords are found in a single pass over the text: with an
+    Aho–Corasick automaton when ``pyahocorasick`` is installed, otherwise
+    with one compiled regular expression alternation. Bytes-like input
+    (including an ``mmap``) is scanned for the UTF‑8 encoded keywords with
+    a Hyperscan streaming database when ``hyperscan`` is installed,
+    otherwise with a bytes alternation.
+
+    Args:
+        keywords: Keywords or phrases to search for. Empty strings are
+            ignored.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = [k for k in keywords if k]
+        self._automaton = None
+        self._pattern = None
+        self._encoded: Optional[List[bytes]] = None
+        self._owners: List[int] = []
+        self._hyperscan_db = None
+        self._bytes_pattern = None
+        if not self.keywords:
+            return
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(self.keywords):
+                folded = keyword.lower()
+                automaton.add_word(folded, (index, len(folded)))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._pattern, self._prefixes = _overlapping_pattern(self.keywords)
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def finditer(self, text: Union[str, bytes, bytearray, memoryview]) -> Iterator[Tuple[int, int, int]]:
+        """Yield ``(start, end, keyword_index)`` for each match in ``text``.
+
+        Every occurrence of every keyword is reported, including
+        overlapping ones. The order of matches is unspecified. For
+        bytes-like input the offsets are byte offsets; non-ASCII letters
+        match case insensitively when the whole word is in the keyword's
+        lower, upper or casefolded form.
+        """
+        if not isinstance(text, str):
+            if self.keywords:
+                yield from self._finditer_bytes(text)
+            return
+        if self._automaton is not None:
+            folded = text.lower()
+            if len(folded) != len(text):
+                # Case folding changed the length (rare non-ASCII letters);
+                # fall back to a per-keyword scan to keep offsets valid
+                yield from self._finditer_slow(text)
+                return
+            for end, (index, length) in self._automaton.iter(folded):
+                yield end - length + 1, end + 1, index
+        elif self._pattern is not None:
+            yield from self._iter_pattern(self._pattern, self._prefixes, self.keywords, text)
+
+    def _encode_keywords(self) -> None:
+        """Build the UTF‑8 byte strings the bytes scanners look for.
+
+        Bytes matching folds ASCII letters only, so a non-ASCII keyword is
+        also searched in its lower, upper and casefolded forms; variants
+        equal up to ASCII case are dropped. _owners maps each byte string
+        back to its keyword index.
+        """
+        encoded: List[bytes] = []
+        owners: List[int] = []
+        for index, keyword in enumerate(self.keywords):
+            forms = [keyword] if keyword.isascii() else [
+                keyword, keyword.lower(), keyword.upper(), keyword.casefold()]
+            folded = set()
+            for form in forms:
+                word = form.encode('utf-8')
+                if word.lower() not in folded:
+                    folded.add(word.lower())
+                    encoded.append(word)
+                    owners.append(index)
+        self._encoded, self._owners = encoded, owners
+
+    def _finditer_bytes(self, data) -> Iterator[Tuple[int, int, int]]:
+        if self._encoded is None:
+            self._encode_keywords()
+            if hyperscan is not None:
+                try:
+                    self._hyperscan_db = _hyperscan_database(self._encoded)
+                except hyperscan.error:
+                    self._hyperscan_db = None
+            if self._hyperscan_db is None:
+                self._bytes_pattern, self._bytes_prefixes = _overlapping_pattern(self._encoded)
+
+        if self._hyperscan_db is not None:
+            matches = self._finditer_hyperscan(data)
+        else:
+            matches = self._iter_pattern(self._bytes_pattern, self._bytes_prefixes, self._encoded, data)
+        owners = self._owners
+        try:
+            for start, end, variant in matches:
+                yield start, end, owners[variant]
+        finally:
+            # Release the scanner's view of data before the caller closes it
+            matches.close()
+
+    def _finditer_hyperscan(self, data) -> Iterator[Tuple[int, int, int]]:
+        # Hyperscan reports the end of every match, overlapping ones
+        # included; literals have a fixed length, which gives the start.
+        # The data goes through a stream in chunks, so no copy of a whole
+        # mapped file is made and matches may span chunk boundaries.
+        lengths = [len(word) for word in self._encoded]
+        found: List[Tuple[int, int, int]] = []
+
+        def on_match(index, start, end, flags, context):
+            found.append((end - lengths[index], end, index))
+
+        with memoryview(data) as view, self._hyperscan_db.stream(match_event_handler=on_match) as stream:
+            for pos in range(0, view.nbytes, HYPERSCAN_CHUNK_SIZE):
+                stream.scan(view[pos:pos + HYPERSCAN_CHUNK_SIZE].tobytes())
+                yield from found
+                found.clear()
+        yield from found
+
+    @staticmethod
+    def _iter_pattern(pattern, prefixes, words, text) -> Iterator[Tuple[int, int, int]]:
+        for match in pattern.finditer(text):
+            group = match.lastgroup
+            index = int(group[1:])
+            start = match.start()
+            yield start, match.end(group), index
+            for other in prefixes[index]:
+                yield start, start + len(words[other]), other
+
+    def _finditer_slow(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        matches = []
+        for index, keyword in enumerate(self.keywords):
+            for match in re.finditer(re.escape(keyword), text, flags=re.IGNORECASE):
+                matches.append((match.end(), match.start(), index))
+        for end, start, index in sorted(matches):
+            yield start, end, index
+
+
+def newline_offsets(data) -> Sequence[int]:
+    """Return the offsets of every newline byte in data, in order.
+
+    With numpy available the scan is one vectorized compare over the
+    buffer (no copy is made of an ``mmap`` or bytes object) and an array is
+    returned; otherwise ``find`` is called repeatedly.
+
+    Args:
+        data: Bytes-like object, such as an ``mmap``
+    """
+    if np is not None:
+        return np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 10)
+
+    offsets = []
+    find = data.find
+    pos = find(b'\n')
+    while pos != -1:
+        offsets.append(pos)
+        pos = find(b'\n', pos + 1)
+    return offsets
+
+
+def looks_like_text(head: bytes) -> bool:
+    """Guess from a file's first bytes whether it holds text.
+
+    Files with NUL bytes (which also rules out UTF‑16 text) or starting
+    with a BINARY_SIGNATURES entry are treated as binary.
+    """
+    return b'\x00' not in head and not head.startswith(BINARY_SIGNATURES)
+
+
+def search_file(path: str, matcher: KeywordMatcher, limit: Optional[int] = None,
+                text_only: bool = False) -> List[Dict[str, Any]]:
+    """Find keyword matches in one file, reporting each keyword once per line.
+
+    The file is memory-mapped and scanned as bytes, so it is never read
+    into memory or decoded as a whole; only the context of each match is
+    decoded (as UTF‑8, dropping invalid bytes).
+
+    Args:
+        path: File to scan.
+        matcher: Keywords to look for.
+        limit: Stop after this many results.
+        text_only: Skip the file, without mapping it, if its first
+            SNIFF_SIZE bytes fail looks_like_text.
+
+    Returns:
+        A list of dictionaries with keys ``file``, ``line`` (1-based),
+        ``context`` (the match with up to 20 bytes either side, within
+        its line) and ``keyword``.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+    """
+    results: List[Dict[str, Any]] = []
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return results
+        if text_only and not looks_like_text(f.read(SNIFF_SIZE)):
+            return results
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    matches = matcher.finditer(mm)
+    try:
+        newlines = None
+        seen = set()
+        for start, end, index in matches:
+            if newlines is None:
+                newlines = newline_offsets(mm)
+            line_index = bisect.bisect_left(newlines, start)
+            if (index, line_index) in seen:
+                continue
+            seen.add((index, line_index))
+
+            line_start = int(newlines[line_index - 1]) + 1 if line_index else 0
+            line_end = int(newlines[line_index]) if line_index < len(newlines) else len(mm)
+            context = mm[max(line_start, start - 20):min(line_end, end + 20)]
+            results.append({
+                'file': path,
+                'line': line_index + 1,
+                'context': context.decode('utf-8', errors='ignore'),
+                'keyword': matcher.keywords[index],
+            })
+            if limit is not None and len(results) >= limit:
+                break
+    finally:
+        # The regex scanner holds a view of the map until it is released
+        matches.close()
+        mm.close()
+    return results
+
+
+# Matcher of a search worker process, built once by _init_search_worker
+_worker_matcher: Optional[KeywordMatcher] = None
+
+
+def _init_search_worker(keywords: List[str]) -> None:
+    global _worker_matcher
+    _worker_matcher = KeywordMatcher(keywords)
+
+
+def _search_file_in_worker(path: str, limit: Optional[int], text_only: bool) -> List[Dict[str, Any]]:
+    try:
+        return search_file(path, _worker_matcher, limit, text_only)
+    except (OSError, ValueError):
+        return []
+
+
+def search_files(paths: Iterable[str], keywords: List[str], limit: Optional[int] = None,
+                 workers: Optional[int] = None, text_only: bool = False) -> Iterator[List[Dict[str, Any]]]:
+    """Search many files for keywords across a pool of worker processes.
+
+    Paths are consumed lazily, so a directory walk producing them overlaps
+    with the scanning, and each worker compiles the keywords once. Results
+    come back in the order of ``paths``; files that cannot be read or have
+    no matches are skipped. Closing the iterator early cancels the queued
+    files.
+
+    Args:
+        paths: Files to scan.
+        keywords: Keywords or phrases to search for.
+        limit: Most results reported for any one file.
+        workers: Number of processes; defaults to the CPU count. With one
+            the files are scanned in this process.
+        text_only: Skip files that look binary (see search_file).
+
+    Returns:
+        An iterator of the search_file results of each file with matches.
+    """
+    matcher = KeywordMatcher(keywords)
+    if not matcher:
+        return
+    workers = workers or os.cpu_count() or 1
+
+    if workers < 2:
+        for path in paths:
+            try:
+                found = search_file(path, matcher, limit, text_only)
+            except (OSError, ValueError):
+                continue
+            if found:
+                yield found
+        return
+
+    # spawn rather than fork: searches are started from a GUI worker thread
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_search_worker,
+        initargs=(matcher.keywords,),
+    )
+    pending = deque()
+    try:
+        for path in paths:
+            pending.append(pool.submit(_search_file_in_worker, path, limit, text_only))
+            if len(pending) >= workers * SEARCH_QUEUE_DEPTH:
+                found = pending.popleft().result()
+                if found:
+                    yield found
+        while pending:
+            found = pending.popleft().result()
+            if found:
+                yield found
+    finally:
+        # Cancel by hand: shutdown(cancel_futures=True) needs Python 3.9
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
 
 
 def _read_text_from_file(path: str, max_bytes: Optional[int] = None) -> Optional[str]:
@@ -72,11 +467,9 @@ def search_keywords(base_path: str, keywords: List[str], max_bytes: Optional[int
     """
     if not os.path.isdir(base_path):
         raise NotADirectoryError(f"Search base path is not a directory: {base_path}")
-    # Prepare regular expression with all keywords joined by | for OR matching
-    escaped = [re.escape(k) for k in keywords if k]
-    if not escaped:
+    matcher = KeywordMatcher(keywords)
+    if not matcher:
         return []
-    pattern = re.compile('|'.join(escaped), flags=re.IGNORECASE)
     results: List[Dict[str, Any]] = []
     for root, dirs, files in os.walk(base_path):
         for fname in files:
@@ -84,15 +477,15 @@ def search_keywords(base_path: str, keywords: List[str], max_bytes: Optional[int
             text = _read_text_from_file(full_path, max_bytes)
             if text is None:
                 continue
-            for match in pattern.finditer(text):
-                start = max(0, match.start() - 40)
-                end = min(len(text), match.end() + 40)
+            for match_start, match_end, _ in matcher.finditer(text):
+                start = max(0, match_start - 40)
+                end = min(len(text), match_end + 40)
                 context = text[start:end]
                 # Clean up newlines in context for display purposes
                 context = context.replace('\n', ' ').replace('\r', '')
                 results.append({
                     'file': full_path,
-                    'keyword': match.group(0),
+                    'keyword': text[match_start:match_end],
                     'context': context
                 })
     return results
\ No newline at end of file
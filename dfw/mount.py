@@ -30,6 +30,11 @@ try:
 except ImportError:
     pytsk3 = None  # type: ignore
 
+# Partition table line of mmls output
+# Example line: "000:  0000002048  0009764863  0009762816  NTFS (0x07)"
+_PARTITION_RE = re.compile(
+    r"^\s*(\d+):\s+([0-9A-Fa-f]+)\s+([0-9A-Fa-f]+)\s+([0-9A-Fa-f]+)\s+(.*)$")
+
 
 @dataclass
 class Partition:
@@ -51,14 +56,51 @@ class Partition:
     offset: int
 
 
+def _read_partition_table(image_path: str) -> List[Partition]:
+    """Read a disk image's partition table in-process with pytsk3.
+
+    This walks the same volume system structures ``mmls`` prints, so
+    the entries (including unallocated and metadata slots) match its
+    output, without starting a process or parsing text.
+
+    Args:
+        image_path: Path to a raw disk image (e.g. ``.dd`` file).
+
+    Returns:
+        A list of ``Partition`` instances, one per volume system entry.
+
+    Raises:
+        OSError: If the image cannot be opened or has no partition table.
+    """
+    img = pytsk3.Img_Info(image_path)
+    volume = pytsk3.Volume_Info(img)
+    block_size = volume.info.block_size
+    partitions: List[Partition] = []
+    for part in volume:
+        desc = part.desc
+        if isinstance(desc, bytes):
+            desc = desc.decode("utf-8", "replace")
+        partitions.append(Partition(
+            index=part.addr,
+            start_sector=part.start,
+            end_sector=part.start + part.len - 1,
+            length=part.len,
+            description=desc.strip(),
+            offset=part.start * block_size
+        ))
+    return partitions
+
+
 def parse_partitions(image_path: str) -> List[Partition]:
     """Return a list of Partition objects discovered in a disk image.
 
-    This function invokes ``mmls`` (part of The Sleuth Kit) on the
-    provided image file and parses its output to extract partition
-    information. Only lines matching the expected partition table
-    output are considered. If ``mmls`` is unavailable or an error
-    occurs, an empty list is returned.
+    When ``pytsk3`` is installed the partition table is read directly
+    through Sleuth Kit's bindings. Otherwise (or if that fails) this
+    function invokes ``mmls`` (part of The Sleuth Kit) on the provided
+    image file and parses its output to extract partition information.
+    Only lines matching the expected partition table output are
+    considered. If ``mmls`` is unavailable or an error occurs, an empty
+    list is returned.
 
     Args:
         image_path: Path to a raw disk image (e.g. ``.dd`` file).
@@ -68,6 +110,11 @@ def parse_partitions(image_path: str) -> List[Partition]:
         found in the image. If no partitions are found or an error
         occurs, the list will be empty.
     """
+    if pytsk3 is not None:
+        try:
+            return _read_partition_table(image_path)
+        except OSError:
+            pass
     try:
         result = subprocess.run([
             "mmls", image_path
@@ -75,12 +122,9 @@ def parse_partitions(image_path: str) -> List[Partition]:
     except (subprocess.CalledProcessError, FileNotFoundError):
         return []
     partitions: List[Partition] = []
-    # Regular expression to match partition table lines
-    # Example line: "000:  0000002048  0009764863  0009762816  NTFS (0x07)"
-    partition_re = re.compile(
-        r"^\s*(\d+):\s+([0-9A-Fa-f]+)\s+([0-9A-Fa-f]+)\s+([0-9A-Fa-f]+)\s+(.*)$")
+    match = _PARTITION_RE.match
     for line in result.stdout.splitlines():
-        m = partition_re.match(line)
+        m = match(line)
         if m:
             index = int(m.group(1))
             start = int(m.group(2), 10)
@@ -348,8 +348,11 @@ class EmbeddedTerminal(Frame):
             insertbackground='lime',
             font=terminal_font,
             wrap=WORD,
+            undo=False,  # Append-only; no undo stack to grow with output
             yscrollcommand=scrollbar.set
         )
+        self.output_text.tag_config("error", foreground="red")
+        self.output_text.tag_config("command", foreground="yellow")
         self.output_text.pack(side=LEFT, fill=BOTH, expand=True)
         scrollbar.config(command=self.output_text.yview)
 
@@ -525,21 +528,15 @@ class EmbeddedTerminal(Frame):
             pass
 
     def _write_output(self, text, tag=None):
-        """Write text to terminal output."""
-        self.output_text.insert(END, text)
-
-        if tag == 'error':
-            # Color error text red
-            start = self.output_text.index("end-2c linestart")
-            end = self.output_text.index("end-1c")
-            self.output_text.tag_add("error", start, end)
-            self.output_text.tag_config("error", foreground="red")
-        elif tag == 'command':
-            # Color commands yellow
-            start = self.output_text.index("end-2c linestart")
-            end = self.output_text.index("end-1c")
-            self.output_text.tag_add("command", start, end)
-            self.output_text.tag_config("command", foreground="yellow")
+        """Write text to terminal output.
+
+        Errors are colored red and commands yellow; the tag is applied by
+        the insert itself, so it covers every line of the text.
+        """
+        if tag in ('error', 'command'):
+            self.output_text.insert(END, text, tag)
+        else:
+            self.output_text.insert(END, text)
 
         # Auto-scroll to bottom
         self.output_text.see(END)
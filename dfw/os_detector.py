@@ -7,12 +7,17 @@ and other operating systems.
 """
 
 import os
+import copy
 import json
 import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass
 from enum import Enum
 
+# iTunes/Finder backup directories are named by 40-character SHA-1 hex digests
+_IOS_BACKUP_DIR_RE = re.compile(r'^[a-f0-9]{40}$')
+
 
 class OSType(Enum):
     """Enumeration of supported operating system types."""
@@ -46,6 +51,78 @@ class OSInfo:
             self.artifacts_found = []
 
 
+def _root_signature(mount_point: str) -> Tuple[int, int, int]:
+    """Identify the filesystem mounted at a path.
+
+    Device, inode and modification time of the root change when a
+    different image is mounted there, so results keyed on them stay valid
+    for as long as the same filesystem is.
+    """
+    st = os.stat(mount_point)
+    return st.st_dev, st.st_ino, st.st_mtime_ns
+
+
+def _persistent_signature(mount_point: str, source: Optional[str]) -> List[Any]:
+    """Identify what is mounted in a way that survives remounting.
+
+    The device number in _root_signature changes on almost every loop or
+    FUSE remount, so saved results are keyed on the backing image's path,
+    size and modification time when it is known, and otherwise on the
+    root's inode and modification time alone.
+    """
+    if source:
+        st = os.stat(source)
+        return ['image', os.path.abspath(source), st.st_size, st.st_mtime_ns]
+    st = os.stat(mount_point)
+    return ['root', st.st_ino, st.st_mtime_ns]
+
+
+@lru_cache(maxsize=32)
+def _detect_cached(mount_point: str, signature: Tuple[int, int, int]) -> "OSInfo":
+    """Run detection once per (mount point, root signature)."""
+    return OSDetector(mount_point)._detect_uncached()
+
+
+def _load_detection(cache_file: str, key: str,
+                    signature: List[Any]) -> Optional["OSInfo"]:
+    """Return a detection result saved by _save_detection, if still valid."""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entry = json.load(f).get(key)
+        if not entry or entry['signature'] != signature:
+            return None
+        fields = dict(entry['os_info'])
+        fields['os_type'] = OSType(fields['os_type'])
+        return OSInfo(**fields)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_detection(cache_file: str, key: str,
+                    signature: List[Any], info: "OSInfo") -> None:
+    """Record a detection result under key in cache_file.
+
+    The file is replaced atomically, so an interrupted write cannot leave
+    it truncated.
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        entries = {}
+
+    fields = asdict(info)
+    fields['os_type'] = info.os_type.value
+    entries[key] = {'signature': signature, 'os_info': fields}
+    tmp_file = cache_file + '.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
 class OSDetector:
     """Automatic operating system detection for forensic analysis."""
 
@@ -58,12 +135,54 @@ class OSDetector:
         self.mount_point = mount_point
         self.os_info = None
 
-    def detect(self) -> OSInfo:
+    def detect(self, cache_file: Optional[str] = None, source: Optional[str] = None) -> OSInfo:
         """Perform OS detection and return detailed information.
 
+        Results are memoized per mount point for as long as the same
+        filesystem is mounted there (see clear_cache), and with cache_file
+        they are also saved to disk so a reopened case need not detect
+        again.
+
+        Args:
+            cache_file: Optional JSON file to load and save results in
+            source: Optional image file mounted at the mount point; saved
+                results are then found again wherever the image is mounted
+
         Returns:
             OSInfo object containing detected OS details
         """
+        try:
+            signature = _root_signature(self.mount_point)
+        except OSError:
+            return self._detect_uncached()
+
+        result = None
+        if cache_file:
+            key = os.path.abspath(source) if source else self.mount_point
+            try:
+                saved_signature = _persistent_signature(self.mount_point, source)
+            except OSError:
+                cache_file = None
+            else:
+                result = _load_detection(cache_file, key, saved_signature)
+        if result is None:
+            result = _detect_cached(self.mount_point, signature)
+            if cache_file:
+                _save_detection(cache_file, key, saved_signature, result)
+
+        # Callers get their own copy; the cached one must not change
+        result = copy.deepcopy(result)
+        if result.os_type != OSType.UNKNOWN:
+            self.os_info = result
+        return result
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget memoized detection results (e.g. after an unmount)."""
+        _detect_cached.cache_clear()
+
+    def _detect_uncached(self) -> OSInfo:
+        """Run every detector and return the first confident result."""
         # Try each detection method in order of specificity
         detectors = [
             self._detect_windows,
@@ -391,11 +510,10 @@ class OSDetector:
                 artifacts.append(filename)
 
         # Check for backup directory structure (40-char hex names)
-        hex_pattern = re.compile(r'^[a-f0-9]{40}$')
         dirs_found = 0
         try:
             for item in os.listdir(self.mount_point):
-                if hex_pattern.match(item):
+                if _IOS_BACKUP_DIR_RE.match(item):
                     dirs_found += 1
                     if dirs_found >= 5:
                         confidence += 0.2
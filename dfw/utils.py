@@ -1,12 +1,18 @@
 """Utility functions for DFW."""
 
 import os
+import errno
 import hashlib
 import datetime
+import mmap
+import shutil
 import subprocess
 import platform
+import queue
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 
 def calculate_file_hash(file_path: str, algorithm: str = "sha256") -> str:
@@ -14,20 +20,246 @@ def calculate_file_hash(file_path: str, algorithm: str = "sha256") -> str:
 
     Args:
         file_path: Path to file
-        algorithm: Hash algorithm (md5, sha1, sha256)
+        algorithm: Hash algorithm (md5, sha1, sha256, blake2b)
 
     Returns:
         Hex digest of hash
     """
-    hash_obj = hashlib.new(algorithm)
-
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            hash_obj.update(chunk)
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
+        hash_obj = hashlib.new(algorithm)
+        buf = bytearray(1024 * 1024)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            hash_obj.update(view[:n])
 
     return hash_obj.hexdigest()
 
 
+def read_ahead(file_path: str, chunk_size: int = 4 * 1024 * 1024,
+               depth: int = 4) -> Iterator[memoryview]:
+    """Read a file sequentially while the caller processes earlier chunks.
+
+    A background thread keeps up to ``depth`` chunks read ahead into a
+    fixed pool of reusable buffers, so disk reads overlap with whatever
+    the caller does with each chunk (e.g. hashing, which releases the GIL).
+    Each yielded view is only valid until the next chunk is requested.
+
+    Args:
+        file_path: Path to file
+        chunk_size: Bytes per chunk
+        depth: Number of chunks to keep in flight
+
+    Yields:
+        Memoryview over the next chunk of the file
+    """
+    free: "queue.Queue[bytearray]" = queue.Queue()
+    filled: "queue.Queue[Any]" = queue.Queue()
+    for _ in range(depth + 1):
+        free.put(bytearray(chunk_size))
+    stop = threading.Event()
+
+    def reader() -> None:
+        try:
+            with open(file_path, 'rb', buffering=0) as f:
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        # Pipes reject the hint (ESPIPE); it is only advice
+                        pass
+                while not stop.is_set():
+                    buf = free.get()
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    filled.put((buf, n))
+            filled.put(None)
+        except BaseException as e:
+            filled.put(e)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = filled.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            buf, n = item
+            yield memoryview(buf)[:n]
+            free.put(buf)
+    finally:
+        # Unblock and retire the reader if the caller stopped early
+        stop.set()
+        free.put(bytearray(0))
+        thread.join()
+
+
+def iter_image_chunks(file_path: str,
+                      chunk_size: int = 4 * 1024 * 1024) -> Iterator[memoryview]:
+    """Iterate over a disk image in order, without copying it through read().
+
+    The image is memory-mapped read-only and yielded as zero-copy slices of
+    the mapping; the kernel is advised that access is sequential and that
+    the pages will be needed, so it reads ahead aggressively. Files that
+    cannot be mapped (empty files, some devices and pipes) are read with
+    read_ahead() instead. Each yielded view is only valid until the next
+    chunk is requested.
+
+    Args:
+        file_path: Path to image file
+        chunk_size: Bytes per chunk
+
+    Yields:
+        Memoryview over the next chunk of the image
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        yield from read_ahead(file_path, chunk_size)
+        return
+
+    try:
+        if hasattr(mm, 'madvise'):
+            for advice in ('MADV_SEQUENTIAL', 'MADV_WILLNEED'):
+                if hasattr(mmap, advice):
+                    mm.madvise(getattr(mmap, advice))
+
+        view = memoryview(mm)
+        try:
+            for offset in range(0, len(mm), chunk_size):
+                chunk = view[offset:offset + chunk_size]
+                try:
+                    yield chunk
+                finally:
+                    chunk.release()
+        finally:
+            view.release()
+    finally:
+        mm.close()
+
+
+def tree_hash(file_path: str, algorithm: str = "sha256",
+              slice_size: int = 256 * 1024 * 1024,
+              max_workers: Optional[int] = None) -> Tuple[str, List[Tuple[int, str]]]:
+    """Hash a file as independent slices in parallel, then hash the digests.
+
+    Each slice is hashed on its own thread (hashlib releases the GIL for
+    large updates), so throughput scales with cores until the disk is the
+    bottleneck. The root is the hash of the slice digests concatenated in
+    offset order; it is not the same value as a plain hash of the file.
+
+    Args:
+        file_path: Path to file
+        algorithm: Hash algorithm for slices and root
+        slice_size: Bytes per independently hashed slice
+        max_workers: Worker threads (defaults to the CPU count)
+
+    Returns:
+        Tuple of (root hex digest, list of (offset, slice hex digest))
+    """
+    file_size = os.path.getsize(file_path)
+    offsets = range(0, file_size, slice_size) if file_size else range(1)
+
+    def hash_slice(offset: int) -> bytes:
+        hash_obj = hashlib.new(algorithm)
+        buf = bytearray(min(slice_size, 4 * 1024 * 1024))
+        view = memoryview(buf)
+        remaining = slice_size
+        with open(file_path, 'rb', buffering=0) as f:
+            f.seek(offset)
+            while remaining:
+                n = f.readinto(view[:min(remaining, len(buf))])
+                if not n:
+                    break
+                hash_obj.update(view[:n])
+                remaining -= n
+        return hash_obj.digest()
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        digests = list(executor.map(hash_slice, offsets))
+
+    root = hashlib.new(algorithm, b"".join(digests)).hexdigest()
+    return root, [(offset, digest.hex()) for offset, digest in zip(offsets, digests)]
+
+
+# Bytes per copy_file_range call; older kernels cap a single call near 2 GiB
+COPY_CHUNK_SIZE = 1024 * 1024 * 1024
+
+# copy_file_range refusals that mean "use an ordinary copy instead"
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                         errno.EOPNOTSUPP, errno.EPERM, errno.EBADF}
+
+
+def copy_file(src: str, dst: str) -> None:
+    """Copy a file's data and metadata without a userspace buffer.
+
+    On Linux the data is copied with os.copy_file_range, which stays in
+    the kernel and can share extents (reflink) or copy server-side where
+    the filesystem supports it. Where that is unavailable or refused,
+    shutil.copyfile is used, which itself copies with sendfile on Linux
+    and fcopyfile on macOS. Timestamps and mode are copied as by
+    shutil.copy2.
+
+    Args:
+        src: File to copy
+        dst: Destination file path
+    """
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            try:
+                while os.copy_file_range(in_fd, out_fd, COPY_CHUNK_SIZE):
+                    pass
+                copied = True
+            except OSError as e:
+                # Only fall back if nothing was written before the refusal
+                if e.errno not in _COPY_FALLBACK_ERRNOS or os.fstat(out_fd).st_size:
+                    raise
+
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+# Byte -> itself if printable ASCII, else '.', for bytes.translate()
+_HEXDUMP_ASCII = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+
+
+def hexdump(data: bytes, offset: int = 0, uppercase: bool = False) -> str:
+    """Format bytes as a classic 16-bytes-per-row hex dump.
+
+    Each row reads "OFFSET  xx xx ... xx  |ascii|". The hex and ASCII
+    columns for the whole buffer are produced by single C calls
+    (bytes.hex and bytes.translate), leaving only per-row slicing in
+    Python.
+
+    Args:
+        data: Bytes to format
+        offset: Offset of data[0], used for the row labels
+        uppercase: Use upper-case hex digits
+
+    Returns:
+        The dump, rows separated by newlines
+    """
+    hex_data = data.hex(' ')
+    if uppercase:
+        hex_data = hex_data.upper()
+    ascii_data = data.translate(_HEXDUMP_ASCII).decode('ascii')
+    row_format = '{:08X}  {:<48} |{}|' if uppercase else '{:08x}  {:<48} |{}|'
+
+    return '\n'.join([
+        row_format.format(offset + i, hex_data[3 * i:3 * i + 47], ascii_data[i:i + 16])
+        for i in range(0, len(data), 16)
+    ])
+
+
 def format_bytes(size: int) -> str:
     """Format byte size to human readable.
 
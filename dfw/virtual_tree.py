@@ -0,0 +1,474 @@
+"""Virtualized treeviews for very large result lists and file trees.
+
+A plain ttk.Treeview keeps a Tcl item for every row, which makes tables
+with hundreds of thousands of rows (Plaso super timelines, broad keyword
+searches) slow to fill and heavy to hold. VirtualTreeview keeps the rows in
+a temporary SQLite table instead and only materializes the rows that fit in
+the widget, rebuilding them as the view scrolls. VirtualFileTree does the
+same for a directory hierarchy, keeping its nodes in Python.
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from tkinter import TclError, ttk
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Fallbacks when the theme does not report a row height
+DEFAULT_ROW_HEIGHT = 20
+HEADING_HEIGHT = 25
+
+# Rows moved per mouse wheel notch
+WHEEL_ROWS = 3
+
+# Rows fetched per query by VirtualTreeview.iter_rows
+ITER_BATCH_SIZE = 1000
+
+# Indent per tree level and the open/closed markers of VirtualFileTree
+INDENT = "    "
+OPEN_MARK = "▾ "
+CLOSED_MARK = "▸ "
+LEAF_MARK = "  "
+
+
+class _VirtualScroll:
+    """Scrolling shared by the virtual treeviews.
+
+    Subclasses provide row_count() and _render(); the Tk items only ever
+    hold the page of rows starting at self._first.
+    """
+
+    _heading_height = HEADING_HEIGHT
+
+    def _init_scroll(self, kw: Dict[str, Any]) -> None:
+        """Take yscrollcommand out of the widget options."""
+        self._scroll_command = kw.pop('yscrollcommand', None)
+        self._first = 0
+        self._row_height: Optional[int] = None
+
+    def _bind_scroll(self) -> None:
+        """Re-render on resize, scroll on the mouse wheel and page keys."""
+        self.bind("<Configure>", lambda event: self._render())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(sequence, self._on_wheel)
+        for sequence, step, page in (("<Down>", 1, False), ("<Up>", -1, False),
+                                     ("<Next>", 1, True), ("<Prior>", -1, True)):
+            self.bind(sequence, lambda event, step=step, page=page: self._on_nav_key(step, page))
+
+    def configure(self, cnf=None, **kw):
+        """Configure the widget, keeping yscrollcommand for the virtual view."""
+        if 'yscrollcommand' in kw:
+            self._scroll_command = kw.pop('yscrollcommand')
+            self._update_scrollbar()
+            if cnf is None and not kw:
+                return None
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def yview(self, *args):
+        """Query or change the vertical view, in terms of all rows."""
+        if not args:
+            return self._fractions()
+
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * self.row_count()))
+        elif args[0] == 'scroll':
+            count, what = int(args[1]), args[2]
+            step = self._page_size() if what.startswith('page') else 1
+            self._scroll_to(self._first + count * step)
+        return None
+
+    def yview_moveto(self, fraction: float) -> None:
+        self.yview('moveto', fraction)
+
+    def yview_scroll(self, number: int, what: str) -> None:
+        self.yview('scroll', number, what)
+
+    def _on_wheel(self, event) -> str:
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self._scroll_to(self._first - WHEEL_ROWS)
+        else:
+            self._scroll_to(self._first + WHEEL_ROWS)
+        return "break"
+
+    def _on_nav_key(self, step: int, page: bool) -> Optional[str]:
+        """Move the focus by a row or a page, scrolling past the page edges.
+
+        Only the rows on screen exist as Tk items, so ttk's own key
+        navigation stops at the first and last of them. Moves within the
+        page are left to it; others scroll the view and focus the row.
+        """
+        children = ttk.Treeview.get_children(self)
+        focus = self.focus()
+        pos = children.index(focus) if focus in children else 0
+        page_size = self._page_size()
+        target = self._first + pos + step * (page_size if page else 1)
+        target = max(0, min(target, self.row_count() - 1))
+
+        if not page and self._first <= target < self._first + len(children):
+            return None
+
+        if page:
+            self._scroll_to(self._first + step * page_size)
+        if target < self._first:
+            self._scroll_to(target)
+        elif target >= self._first + page_size:
+            self._scroll_to(target - page_size + 1)
+
+        children = ttk.Treeview.get_children(self)
+        index = target - self._first
+        if 0 <= index < len(children):
+            self.focus(children[index])
+            self.selection_set(children[index])
+        return "break"
+
+    def _scroll_to(self, first: int) -> None:
+        first = max(0, min(first, self.row_count() - self._page_size()))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def _page_size(self) -> int:
+        """Number of rows that fit in the widget."""
+        if self._row_height is None:
+            height = ttk.Style(self).lookup('Treeview', 'rowheight')
+            try:
+                self._row_height = int(height) or DEFAULT_ROW_HEIGHT
+            except (TypeError, ValueError):
+                self._row_height = DEFAULT_ROW_HEIGHT
+        return max(1, (self.winfo_height() - self._heading_height) // self._row_height)
+
+    def _fractions(self) -> Tuple[float, float]:
+        total = self.row_count()
+        if not total:
+            return 0.0, 1.0
+        last = min(total, self._first + self._page_size())
+        return self._first / total, last / total
+
+    def _update_scrollbar(self) -> None:
+        if self._scroll_command is not None:
+            self._scroll_command(*self._fractions())
+
+
+class VirtualTreeview(_VirtualScroll, ttk.Treeview):
+    """Flat, headings-only treeview that renders just the visible rows.
+
+    Data goes in through set_rows() and comes back out through iter_rows()
+    and row_count(); get_children() and item() only see the rows currently
+    on screen. Scrolling works through the usual yview()/yscrollcommand
+    pairing with a scrollbar, the mouse wheel and the arrow and page keys.
+    """
+
+    def __init__(self, master=None, columns: Sequence[str] = (), **kw):
+        self._init_scroll(kw)
+        super().__init__(master, columns=columns, show='headings', **kw)
+
+        self._ncols = len(columns)
+        names = ", ".join(f"c{i}" for i in range(self._ncols))
+        params = ", ".join("?" * self._ncols)
+        self._insert_sql = f"INSERT INTO rows VALUES (?, {params})"
+        self._page_sql = f"SELECT {names} FROM rows WHERE id > ? AND id <= ? ORDER BY id"
+        self._batch_sql = f"SELECT id, {names} FROM rows WHERE id > ? ORDER BY id LIMIT ?"
+
+        # An empty filename gives a private temporary database that SQLite
+        # spills to disk as it grows; rows may be set from worker threads,
+        # and set_rows() leaves the Tk work to the Tk thread
+        self._db = sqlite3.connect("", check_same_thread=False, isolation_level=None)
+        self._db.execute(f"CREATE TABLE rows (id INTEGER PRIMARY KEY, {names})")
+        self._lock = threading.Lock()
+
+        self._total = 0
+        self._bind_scroll()
+
+    def destroy(self) -> None:
+        """Destroy the widget and drop its row store."""
+        with self._lock:
+            self._db.close()
+        super().destroy()
+
+    # Data
+
+    def set_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Replace all rows.
+
+        Args:
+            rows: Value sequences, one per row; short rows are padded with
+                empty strings and long ones truncated to the column count
+        """
+        ncols = self._ncols
+        padding = ("",) * ncols
+
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute("DELETE FROM rows")
+                self._db.executemany(
+                    self._insert_sql,
+                    ((row_id, *(tuple(row) + padding)[:ncols]) for row_id, row in enumerate(rows, 1)),
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            self._total = self._db.execute("SELECT count(*) FROM rows").fetchone()[0]
+
+        self._first = 0
+        if threading.current_thread() is threading.main_thread():
+            self._render()
+        else:
+            # Tk may only be used from its own thread
+            self.after(0, self._render)
+
+    def row_count(self) -> int:
+        """Number of rows held, visible or not."""
+        return self._total
+
+    def iter_rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Iterate over all rows in order.
+
+        Rows are fetched ITER_BATCH_SIZE at a time, each batch by its own
+        query under the lock, so no cursor stays open while the caller
+        works and only one batch is held in memory.
+        """
+        last_id = 0
+        while True:
+            with self._lock:
+                batch = self._db.execute(self._batch_sql, (last_id, ITER_BATCH_SIZE)).fetchall()
+            if not batch:
+                return
+            last_id = batch[-1][0]
+            for row in batch:
+                yield row[1:]
+
+    # Rendering
+
+    def _render(self) -> None:
+        """Rebuild the Tk items for the rows in view."""
+        first = self._first
+        with self._lock:
+            rows = self._db.execute(self._page_sql, (first, first + self._page_size())).fetchall()
+
+        children = super().get_children()
+        if children:
+            self.delete(*children)
+        insert = self.insert
+        for values in rows:
+            insert('', 'end', values=values)
+
+        self._update_scrollbar()
+
+
+@dataclass
+class FileNode:
+    """One entry of a VirtualFileTree.
+
+    Attributes:
+        text: Label shown for the entry
+        path: Filesystem path, or "" for informational rows
+        expandable: Whether the entry can be opened (a directory)
+        depth: Nesting level, 0 for the root
+        open: Whether the children are shown
+        children: Child nodes, or None until the directory is listed
+    """
+    text: str
+    path: str
+    expandable: bool
+    depth: int = 0
+    open: bool = False
+    children: Optional[List["FileNode"]] = None
+
+
+class VirtualFileTree(_VirtualScroll, ttk.Treeview):
+    """Directory tree that renders just the visible rows.
+
+    The hierarchy lives in FileNode objects, indexed by path; the visible
+    part of it is kept as a flat list in display order, and only the page
+    of that list on screen exists as Tk items (flat rows indented by
+    depth). A directory is listed through `lister` the first time it is
+    opened, so there is no limit on the entries per directory.
+
+    Tk items are recreated on every scroll, so item ids are only valid
+    until the next change of view; each row's values hold its path.
+    """
+
+    _heading_height = 0
+
+    def __init__(self, master=None,
+                 lister: Optional[Callable[[str], List[Tuple[str, str, bool]]]] = None, **kw):
+        """Create the tree.
+
+        Args:
+            master: Parent widget
+            lister: Called with a directory path, returns (text, path,
+                expandable) tuples for its entries in display order
+            **kw: Other ttk.Treeview options
+        """
+        self._init_scroll(kw)
+        super().__init__(master, show='tree', **kw)
+
+        self._lister = lister
+        self._roots: List[FileNode] = []
+        self._nodes: Dict[str, FileNode] = {}
+        self._rows: List[FileNode] = []
+        self._selected: Optional[FileNode] = None
+
+        self._bind_scroll()
+        self.bind("<<TreeviewSelect>>", self._on_select)
+        self.bind("<Return>", lambda event: self._toggle_focus())
+
+    # Data
+
+    def set_root(self, text: str, path: str, rows: List[Tuple[str, str, bool]]) -> None:
+        """Replace the tree with one open root and its listed entries.
+
+        Args:
+            text: Label of the root
+            path: Directory shown at the root
+            rows: The root's entries, as returned by the lister
+        """
+        self.clear()
+        root = FileNode(text, path, True)
+        self._nodes[path] = root
+        self._roots = [root]
+        self._set_children(root, rows)
+        root.open = True
+        self._rows = list(self._visible(root))
+        self._render()
+
+    def clear(self) -> None:
+        """Remove every node."""
+        self._roots = []
+        self._nodes = {}
+        self._rows = []
+        self._selected = None
+        self._first = 0
+        self._render()
+
+    def row_count(self) -> int:
+        """Number of rows in the expanded tree, visible or not."""
+        return len(self._rows)
+
+    def node(self, path: str) -> Optional[FileNode]:
+        """Return the node for a path, if it has been listed."""
+        return self._nodes.get(path)
+
+    # Opening and closing
+
+    def toggle(self, item: str) -> None:
+        """Open a closed directory row or close an open one.
+
+        Args:
+            item: Tk item id of a row currently on screen
+        """
+        index = self._index(item)
+        if index is None:
+            return
+        node = self._rows[index]
+        if node.open:
+            self._close(index)
+        else:
+            self._open(index)
+        self._render()
+
+    def expand_all(self) -> None:
+        """Open every directory that has already been listed."""
+        for node in self._nodes.values():
+            if node.children is not None:
+                node.open = True
+        self._rebuild()
+
+    def collapse_all(self) -> None:
+        """Close every directory, leaving only the roots."""
+        for node in self._nodes.values():
+            node.open = False
+        self._rebuild()
+
+    def _open(self, index: int) -> None:
+        node = self._rows[index]
+        if not node.expandable:
+            return
+        if node.children is None:
+            rows = self._lister(node.path) if self._lister else []
+            self._set_children(node, rows)
+        node.open = True
+        visible = self._visible(node)
+        next(visible)
+        self._rows[index + 1:index + 1] = list(visible)
+
+    def _close(self, index: int) -> None:
+        node = self._rows[index]
+        node.open = False
+        end = index + 1
+        while end < len(self._rows) and self._rows[end].depth > node.depth:
+            end += 1
+        del self._rows[index + 1:end]
+        self._first = min(self._first, max(0, len(self._rows) - self._page_size()))
+
+    def _set_children(self, node: FileNode, rows: List[Tuple[str, str, bool]]) -> None:
+        depth = node.depth + 1
+        node.children = [FileNode(text, path, expandable, depth) for text, path, expandable in rows]
+        for child in node.children:
+            if child.path:
+                self._nodes[child.path] = child
+
+    def _visible(self, node: FileNode) -> Iterator[FileNode]:
+        """Yield node and its shown descendants in display order."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            yield current
+            if current.open and current.children:
+                stack.extend(reversed(current.children))
+
+    def _rebuild(self) -> None:
+        self._rows = [row for root in self._roots for row in self._visible(root)]
+        self._first = min(self._first, max(0, len(self._rows) - self._page_size()))
+        self._render()
+
+    # Selection
+
+    def _index(self, item: str) -> Optional[int]:
+        try:
+            index = self._first + super().index(item)
+        except TclError:
+            return None
+        return index if index < len(self._rows) else None
+
+    def _on_select(self, event=None) -> None:
+        selection = self.selection()
+        index = self._index(selection[0]) if selection else None
+        if index is not None:
+            self._selected = self._rows[index]
+
+    def _toggle_focus(self) -> None:
+        item = self.focus()
+        if item:
+            self.toggle(item)
+
+    # Rendering
+
+    def _render(self) -> None:
+        """Rebuild the Tk items for the rows in view."""
+        page = self._rows[self._first:self._first + self._page_size()]
+
+        children = super().get_children()
+        if children:
+            self.delete(*children)
+
+        selected = None
+        insert = self.insert
+        for node in page:
+            if node.expandable:
+                mark = OPEN_MARK if node.open else CLOSED_MARK
+            else:
+                mark = LEAF_MARK
+            item = insert('', 'end', text=f"{INDENT * node.depth}{mark}{node.text}", values=[node.path])
+            if node is self._selected:
+                selected = item
+
+        if selected is not None:
+            self.selection_set(selected)
+            self.focus(selected)
+
+        self._update_scrollbar()